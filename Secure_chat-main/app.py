@@ -1,70 +1,225 @@
-import base64
 import hashlib
-import json
+import itertools
+import logging
 import os
+import queue
+import ssl
+import threading
 import time
-from typing import Any, Dict, List
+from collections import deque
+from functools import lru_cache
+from typing import Any, Deque, Dict, Iterator, List, Optional, Set
 
+import orjson
 from flask import Flask, Response, jsonify, render_template, request
+from flask.json.provider import DefaultJSONProvider
 from flask_socketio import SocketIO, emit
+from sortedcontainers import SortedDict
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
+try:
+    import pybase64 as _b64
+
+    b64encode_str = _b64.b64encode_as_string
+    B64_BACKEND = f"pybase64 {_b64.get_version()}"
+except ImportError:  # pragma: no cover - stdlib fallback
+    import base64 as _b64
+
+    def b64encode_str(data: bytes) -> str:
+        return _b64.b64encode(data).decode()
+
+    B64_BACKEND = "stdlib base64"
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson."""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, default=self.default).decode()
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+
+class OrjsonSocketJSON:
+    """``json``-module shim for Socket.IO packets (orjson returns bytes)."""
+
+    @staticmethod
+    def dumps(obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+    @staticmethod
+    def loads(s: Any, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
-app.config["SECRET_KEY"] = os.getenv("FLASK_SECRET_KEY", os.urandom(32))
-socketio = SocketIO(app, cors_allowed_origins="*", async_mode="threading")
+# Flask's logger inherits the root WARNING level; show the startup diagnostics
+app.logger.setLevel(logging.INFO)
+app.json = OrjsonProvider(app)
+app.config["SECRET_KEY"] = os.environ.get("FLASK_SECRET_KEY") or os.urandom(32)
+socketio = SocketIO(app, cors_allowed_origins="*", async_mode="threading", json=OrjsonSocketJSON)
 
 participants: Dict[str, Dict[str, Any]] = {}
 sessions: Dict[str, str] = {}
-logs: List[Dict[str, str]] = []
+# Usernames currently in `participants`, kept in step for the per-message envelope check.
+participant_names: Set[str] = set()
+# (lowercased, original) username -> username, kept in roster display order.
+# The original is part of the key so names differing only in case don't collide.
+participants_sorted: SortedDict = SortedDict()
+roster_lock = threading.Lock()
+# Bounded ring buffer: the oldest entries are dropped once LOG_RING_SIZE is reached.
+logs: Deque[Dict[str, str]] = deque(maxlen=int(os.getenv("LOG_RING_SIZE", 100_000)))
+logs_lock = threading.Lock()
+
+# Messages are encrypted into `logs` off the request path by a background writer.
+LOG_BATCH_SIZE = 64
+_log_queue: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+
+# Roster snapshot rebuilt lazily; cleared whenever someone joins or leaves.
+_snapshot_cache: Optional[List[Dict[str, str]]] = None
+_snapshot_json: Optional[bytes] = None
+
+# [epoch second, formatted UTC timestamp]; a racing thread at worst reformats.
+_ts_cache: List[Any] = [0, ""]
 
 LOG_KEY_B64 = os.getenv("SERVER_LOG_KEY_B64")
 if LOG_KEY_B64:
-    LOG_KEY = base64.b64decode(LOG_KEY_B64)
+    LOG_KEY = _b64.b64decode(LOG_KEY_B64)
 else:
     LOG_KEY = AESGCM.generate_key(bit_length=256)
     app.logger.warning(
         "Generated ephemeral log key; set SERVER_LOG_KEY_B64 to persist logs across restarts."
     )
-log_cipher = AESGCM(LOG_KEY)
+# Key schedule is built once; only the GCM mode is rebuilt per nonce.
+log_algorithm = algorithms.AES(LOG_KEY)
+
+# 96-bit GCM nonces: random 32-bit per-process prefix + 64-bit counter.
+# The fresh prefix keeps nonces unique across restarts sharing SERVER_LOG_KEY_B64.
+_nonce_prefix = os.urandom(4)
+_nonce_counter = itertools.count()
+app.logger.info("Base64 codec: %s", B64_BACKEND)
+app.logger.info("OpenSSL: %s", ssl.OPENSSL_VERSION)
+if hashlib.sha256.__name__ != "openssl_sha256":
+    app.logger.warning("hashlib is not using OpenSSL for SHA-256; fingerprints use the slower builtin.")
 
 
+@lru_cache(maxsize=4096)
 def compute_fingerprint(public_key_b64: str) -> str:
-    der = base64.b64decode(public_key_b64)
-    digest = hashlib.sha256(der).hexdigest()
-    return ":".join(digest[i : i + 2] for i in range(0, len(digest), 2))
+    der = _b64.b64decode(public_key_b64)
+    return hashlib.sha256(der).digest().hex(":")
+
+
+def encrypt_log_payload(nonce: bytes, plaintext: bytes) -> bytes:
+    encryptor = Cipher(log_algorithm, modes.GCM(nonce)).encryptor()
+    ciphertext = encryptor.update(plaintext) + encryptor.finalize()
+    return ciphertext + encryptor.tag
+
+
+def invalidate_snapshot() -> None:
+    global _snapshot_cache, _snapshot_json
+    _snapshot_cache = None
+    _snapshot_json = None
+
+
+def _cached_snapshot() -> List[Dict[str, str]]:
+    # Caller must hold roster_lock so a concurrent invalidation can't be overwritten.
+    global _snapshot_cache
+    if _snapshot_cache is None:
+        snapshot = []
+        for username in participants_sorted.values():
+            info = participants[username]
+            snapshot.append(
+                {
+                    "username": username,
+                    "fingerprint": info["fingerprint"],
+                    "public_key": info["public_key"],
+                }
+            )
+        _snapshot_cache = snapshot
+    return _snapshot_cache
 
 
 def participant_snapshot() -> List[Dict[str, str]]:
-    return [
-        {
-            "username": username,
-            "fingerprint": info["fingerprint"],
-            "public_key": info["public_key"],
-        }
-        for username, info in sorted(participants.items(), key=lambda item: item[0].lower())
-    ]
+    snapshot = _snapshot_cache
+    if snapshot is None:
+        with roster_lock:
+            snapshot = _cached_snapshot()
+    return snapshot
+
+
+def participant_snapshot_json() -> bytes:
+    global _snapshot_json
+    body = _snapshot_json
+    if body is None:
+        with roster_lock:
+            body = _snapshot_json
+            if body is None:
+                body = orjson.dumps({"participants": _cached_snapshot()})
+                _snapshot_json = body
+    return body
 
 
 def broadcast_participants() -> None:
     socketio.emit("participants", {"participants": participant_snapshot()})
 
 
+def utc_timestamp() -> str:
+    now = int(time.time())
+    if _ts_cache[0] != now:
+        _ts_cache[1] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now))
+        _ts_cache[0] = now
+    return _ts_cache[1]
+
+
+def encrypt_log_entry(entry_payload: Dict[str, Any]) -> Dict[str, str]:
+    nonce = _nonce_prefix + next(_nonce_counter).to_bytes(8, "big")
+    serialized = orjson.dumps(entry_payload)
+    ciphertext = encrypt_log_payload(nonce, serialized)
+    return {
+        "nonce": b64encode_str(nonce),
+        "ciphertext": b64encode_str(ciphertext),
+    }
+
+
+def log_writer() -> None:
+    while True:
+        batch = [_log_queue.get()]
+        while len(batch) < LOG_BATCH_SIZE:
+            try:
+                batch.append(_log_queue.get_nowait())
+            except queue.Empty:
+                break
+
+        entries = []
+        for entry_payload in batch:
+            try:
+                entries.append(encrypt_log_entry(entry_payload))
+            except Exception:  # keep the writer alive for later messages
+                app.logger.exception("Failed to encrypt log entry")
+        with logs_lock:
+            logs.extend(entries)
+
+
 def store_encrypted_log(payload: Dict[str, Any]) -> None:
     entry_payload = dict(payload)
-    entry_payload.setdefault("stored_at", time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()))
-    nonce = os.urandom(12)
-    serialized = json.dumps(entry_payload, separators=(",", ":")).encode()
-    ciphertext = log_cipher.encrypt(nonce, serialized, associated_data=None)
-    logs.append(
-        {
-            "nonce": base64.b64encode(nonce).decode(),
-            "ciphertext": base64.b64encode(ciphertext).decode(),
-        }
-    )
+    entry_payload.setdefault("stored_at", utc_timestamp())
+    _log_queue.put(entry_payload)
+
+
+def collect_encrypted_logs() -> Iterator[Dict[str, str]]:
+    # Iterate a copy: a deque raises if it is appended to mid-iteration.
+    with logs_lock:
+        snapshot = list(logs)
+    yield from snapshot
 
 
-def collect_encrypted_logs() -> List[Dict[str, str]]:
-    return list(logs)
+def stream_encrypted_logs() -> Iterator[bytes]:
+    yield b'{"entries":['
+    for index, entry in enumerate(collect_encrypted_logs()):
+        yield b"," + orjson.dumps(entry) if index else orjson.dumps(entry)
+    yield b"]}"
 
 
 def remove_participant(sid: str) -> None:
@@ -72,9 +227,13 @@ def remove_participant(sid: str) -> None:
     if not username:
         return
 
-    info = participants.pop(username, None)
-    if not info:
-        return
+    with roster_lock:
+        info = participants.pop(username, None)
+        if not info:
+            return
+        participant_names.discard(username)
+        participants_sorted.pop((username.lower(), username), None)
+        invalidate_snapshot()
 
     socketio.emit(
         "user_left",
@@ -89,14 +248,18 @@ def index() -> str:
     return render_template("index.html")
 
 
+# Prebuilt body; a fresh Response per request since Flask mutates response headers.
+HEALTH_BODY = b'{"status":"ok"}'
+
+
 @app.route("/health")
-def health() -> Dict[str, str]:
-    return {"status": "ok"}
+def health() -> Response:
+    return Response(HEALTH_BODY, mimetype="application/json")
 
 
 @app.route("/api/users")
 def api_users() -> Response:
-    return jsonify({"participants": participant_snapshot()})
+    return Response(participant_snapshot_json(), mimetype="application/json")
 
 
 @app.route("/logs", methods=["GET"])
@@ -106,7 +269,7 @@ def get_logs() -> Response:
     if token_required and supplied != token_required:
         return jsonify({"error": "unauthorized"}), 401
 
-    return jsonify({"entries": collect_encrypted_logs()})
+    return Response(stream_encrypted_logs(), mimetype="application/json")
 
 
 @socketio.on("register")
@@ -130,12 +293,16 @@ def handle_register(data: Dict[str, Any]) -> None:
 
     remove_participant(request.sid)
 
-    participants[username] = {
-        "public_key": public_key,
-        "fingerprint": fingerprint,
-        "sid": request.sid,
-        "joined_at": time.time(),
-    }
+    with roster_lock:
+        participants[username] = {
+            "public_key": public_key,
+            "fingerprint": fingerprint,
+            "sid": request.sid,
+            "joined_at": time.time(),
+        }
+        participant_names.add(username)
+        participants_sorted[(username.lower(), username)] = username
+        invalidate_snapshot()
     sessions[request.sid] = username
     app.logger.info("%s joined the chat", username)
 
@@ -174,9 +341,8 @@ def handle_send_message(data: Dict[str, Any]) -> None:
         emit("delivery_error", {"message": "Sender not registered."})
         return
 
-    expected_recipients = set(participants.keys())
-    actual_recipients = set(envelopes.keys())
-    missing = expected_recipients - actual_recipients
+    with roster_lock:
+        missing = participant_names.difference(envelopes)
     if missing:
         app.logger.warning(
             "Message rejected: missing envelopes %s from %s",
@@ -225,5 +391,8 @@ def handle_disconnect() -> None:
     remove_participant(request.sid)
 
 
+threading.Thread(target=log_writer, name="log-writer", daemon=True).start()
+
+
 if __name__ == "__main__":
     socketio.run(app, host="0.0.0.0", port=int(os.getenv("PORT", 5000)), debug=False)
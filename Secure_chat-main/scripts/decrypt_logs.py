@@ -1,31 +1,61 @@
 """Utility to decrypt stored message logs using the shared server key."""
 
-import base64
 import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List
 
-from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+import orjson
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+
+try:
+    import pybase64 as _b64
+except ImportError:  # pragma: no cover - stdlib fallback
+    import base64 as _b64
 
 
 def load_key() -> bytes:
     key_b64 = os.getenv("SERVER_LOG_KEY_B64")
     if not key_b64:
         raise RuntimeError("SERVER_LOG_KEY_B64 environment variable is required")
-    key = base64.b64decode(key_b64)
+    key = _b64.b64decode(key_b64)
     if len(key) != 32:
         raise RuntimeError("SERVER_LOG_KEY_B64 must decode to 32 bytes (256 bits)")
     return key
 
 
-def decrypt_entries(entries: List[Dict[str, Any]], aes: AESGCM) -> List[Dict[str, Any]]:
+TAG_SIZE = 16
+
+
+def decrypt_payload(aes: algorithms.AES, nonce: bytes, data: bytes) -> bytes:
+    ciphertext, tag = data[:-TAG_SIZE], data[-TAG_SIZE:]
+    decryptor = Cipher(aes, modes.GCM(nonce, tag)).decryptor()
+    return decryptor.update(ciphertext) + decryptor.finalize()
+
+
+def decrypt_chunk(entries: List[Dict[str, Any]], aes: algorithms.AES) -> List[Dict[str, Any]]:
     decrypted = []
     for entry in entries:
-        nonce = base64.b64decode(entry["nonce"])
-        ciphertext = base64.b64decode(entry["ciphertext"])
-        plaintext = aes.decrypt(nonce, ciphertext, associated_data=None)
-        decrypted.append(json.loads(plaintext.decode()))
+        nonce = _b64.b64decode(entry["nonce"])
+        ciphertext = _b64.b64decode(entry["ciphertext"])
+        plaintext = decrypt_payload(aes, nonce, ciphertext)
+        decrypted.append(orjson.loads(plaintext))
+    return decrypted
+
+
+def decrypt_entries(entries: List[Dict[str, Any]], aes: algorithms.AES) -> List[Dict[str, Any]]:
+    workers = os.cpu_count() or 1
+    chunk_size = max(1, len(entries) // workers)
+    if workers == 1 or len(entries) <= chunk_size:
+        return decrypt_chunk(entries, aes)
+
+    chunks = [entries[i : i + chunk_size] for i in range(0, len(entries), chunk_size)]
+    decrypted: List[Dict[str, Any]] = []
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        # map() yields in submission order, so entry order is preserved.
+        for chunk_result in pool.map(decrypt_chunk, chunks, [aes] * len(chunks)):
+            decrypted.extend(chunk_result)
     return decrypted
 
 
@@ -39,7 +69,7 @@ def main() -> None:
         payload = json.load(handle)
 
     entries = payload.get("entries", [])
-    aes = AESGCM(load_key())
+    aes = algorithms.AES(load_key())
     results = decrypt_entries(entries, aes)
     print(json.dumps(results, indent=2))
 
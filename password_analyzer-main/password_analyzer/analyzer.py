@@ -2,14 +2,135 @@
 Core password analysis using zxcvbn and custom algorithms.
 """
 
+import collections
+import copy
+import functools
+import itertools
 import logging
-from typing import Dict, List, Optional, Any
+import math
+import os
+import string
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Any, Sequence, Tuple
 from zxcvbn import zxcvbn
+from zxcvbn.time_estimates import estimate_attack_times
 from .entropy import EntropyCalculator
 from .pattern_detector import PatternDetector
 
+try:
+    import ahocorasick
+except ImportError:  # Optional: fall back to per-item substring checks
+    ahocorasick = None
+
+try:
+    import resource
+except ImportError:  # Optional: not available on Windows
+    resource = None
+
 logger = logging.getLogger(__name__)
 
+# Maximum number of memoized analyses kept per analyzer
+ANALYSIS_CACHE_SIZE = 8192
+
+# Below this many passwords, process start-up costs more than it saves
+PARALLEL_BATCH_THRESHOLD = 8
+
+# Passwords sent to a worker per task when streaming
+STREAM_CHUNKSIZE = 256
+
+# Chunks in flight per worker when streaming; bounds how far input is read ahead
+STREAM_PREFETCH = 2
+
+# Address-space cap (bytes) for batch worker processes; None leaves it unset.
+# Guards against a pathological input blowing up a worker's memory.
+WORKER_MEMORY_LIMIT = None
+
+# Fast-path triage bounds (entropy bits): below WEAK or above STRONG the
+# verdict is clear without running zxcvbn
+FAST_PATH_WEAK_BITS = 20
+FAST_PATH_STRONG_BITS = 90
+
+# Entropy pool only reached with lowercase, uppercase, digits and symbols all
+# present; long single-class input (e.g. 'a' * 30) is never fast-tracked
+FAST_PATH_STRONG_POOL = 26 + 26 + 10 + len(string.punctuation)
+
+# Patterns that hint at dictionary words or structure zxcvbn would find, so
+# a high-entropy password showing any of them still gets the full analysis
+_FAST_PATH_PATTERNS = (
+    'repeated_sequences',
+    'keyboard_patterns',
+    'dates',
+    'sequential',
+    'leet_speak',
+)
+
+# Per-process analyzer used by batch worker processes
+_worker_analyzer = None
+
+
+@functools.lru_cache(maxsize=128)
+def _contextual_needles(
+    user_inputs: Tuple[str, ...]
+) -> Tuple[Tuple[Tuple[str, str], ...], FrozenSet[str]]:
+    """Filter and lowercase user inputs once per distinct input tuple."""
+    items = tuple((item, item.lower()) for item in user_inputs if item and len(item) >= 3)
+    return items, frozenset(lowered for _, lowered in items)
+
+
+@functools.lru_cache(maxsize=128)
+def _build_contextual_automaton(needles: FrozenSet[str]):
+    """Build (and cache) an Aho-Corasick automaton over lowercased user inputs."""
+    automaton = ahocorasick.Automaton()
+    for needle in needles:
+        automaton.add_word(needle, needle)
+    automaton.make_automaton()
+    return automaton
+
+
+def _default_workers() -> int:
+    """Number of CPUs this process may actually run on."""
+    # cpu_count() reports the whole machine, ignoring container/affinity limits
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0)) or 1
+    return os.cpu_count() or 1
+
+
+def _init_worker(memory_limit: Optional[int] = None):
+    """Create the analyzer once per worker process."""
+    global _worker_analyzer
+    
+    if memory_limit is not None and resource is not None:
+        try:
+            _, hard = resource.getrlimit(resource.RLIMIT_AS)
+            if hard != resource.RLIM_INFINITY:
+                memory_limit = min(memory_limit, hard)
+            resource.setrlimit(resource.RLIMIT_AS, (memory_limit, hard))
+        except (ValueError, OSError) as e:
+            logger.warning(f"Could not limit worker memory: {e}")
+    
+    _worker_analyzer = PasswordAnalyzer()
+
+
+def _analyze_one(
+    password: str,
+    user_inputs: Optional[List[str]],
+    fast: bool = False
+) -> Dict[str, Any]:
+    """Analyze a single password inside a worker process."""
+    return _worker_analyzer.analyze(password, user_inputs=user_inputs, fast=fast)
+
+
+def _analyze_chunk(
+    passwords: List[str],
+    user_inputs: Optional[List[str]],
+    fast: bool = False
+) -> List[Dict[str, Any]]:
+    """Analyze a chunk of passwords inside a worker process."""
+    return [
+        _worker_analyzer.analyze(password, user_inputs=user_inputs, fast=fast)
+        for password in passwords
+    ]
+
 
 class PasswordAnalyzer:
     """
@@ -19,12 +140,17 @@ class PasswordAnalyzer:
     def __init__(self):
         self.entropy_calc = EntropyCalculator()
         self.pattern_detector = PatternDetector()
+        # Analysis is deterministic, so duplicate passwords are served from cache
+        self._analyze_cached = functools.lru_cache(maxsize=ANALYSIS_CACHE_SIZE)(
+            self._analyze_uncached
+        )
     
     def analyze(
         self, 
         password: str, 
         user_inputs: Optional[List[str]] = None,
-        use_entropy: bool = True
+        use_entropy: bool = True,
+        fast: bool = False
     ) -> Dict[str, Any]:
         """
         Perform comprehensive password analysis.
@@ -33,6 +159,7 @@ class PasswordAnalyzer:
             password: The password to analyze
             user_inputs: Optional list of user-specific context (names, emails, etc.)
             use_entropy: Whether to calculate custom entropy metrics
+            fast: Triage obvious extremes (entropy, character classes, patterns) without zxcvbn
             
         Returns:
             Dictionary containing all analysis results
@@ -43,11 +170,33 @@ class PasswordAnalyzer:
                 'score': 0
             }
         
+        # Order is kept: zxcvbn ranks user inputs by position
+        result = self._analyze_cached(password, tuple(user_inputs or ()), use_entropy, fast)
+        
+        # Shallow copy so callers can't rebind keys on the cached result
+        return copy.copy(result)
+    
+    def cache_clear(self):
+        """Discard all memoized analysis results."""
+        self._analyze_cached.cache_clear()
+    
+    def _analyze_uncached(
+        self,
+        password: str,
+        user_inputs: Tuple[str, ...],
+        use_entropy: bool,
+        fast: bool = False
+    ) -> Dict[str, Any]:
+        """Run the full analysis pipeline for one password."""
+        if fast:
+            result = self._analyze_extreme(password, user_inputs, use_entropy)
+            if result is not None:
+                return result
+        
         # Basic zxcvbn analysis (limit password length to avoid errors)
-        user_inputs = user_inputs or []
         # zxcvbn has a max length of 72 characters
         password_for_zxcvbn = password[:72] if len(password) > 72 else password
-        zxcvbn_result = zxcvbn(password_for_zxcvbn, user_inputs=user_inputs)
+        zxcvbn_result = zxcvbn(password_for_zxcvbn, user_inputs=list(user_inputs))
         
         # Pattern detection
         patterns = self.pattern_detector.detect_patterns(password)
@@ -91,17 +240,87 @@ class PasswordAnalyzer:
         
         return result
     
-    def _check_contextual_items(self, password: str, user_inputs: List[str]) -> List[str]:
+    def _analyze_extreme(
+        self,
+        password: str,
+        user_inputs: Tuple[str, ...],
+        use_entropy: bool
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Build a result without zxcvbn for clearly weak or strong passwords.
+        
+        Strong means high entropy from all four character classes with no
+        contextual match or telling pattern. Returns None for everything
+        else, which needs the full pipeline.
+        """
+        entropy_result = self.entropy_calc.calculate(password)
+        entropy_bits = entropy_result['entropy_bits']
+        contextual_matches = self._check_contextual_items(password, user_inputs)
+        
+        if entropy_bits >= FAST_PATH_WEAK_BITS and (
+            entropy_bits <= FAST_PATH_STRONG_BITS or contextual_matches
+        ):
+            return None
+        
+        # Cached, so the full pipeline doesn't repeat it if we bail out below
+        patterns = self.pattern_detector.detect_patterns(password)
+        if entropy_bits > FAST_PATH_STRONG_BITS and (
+            entropy_result['pool_size'] < FAST_PATH_STRONG_POOL
+            or any(patterns[name] for name in _FAST_PATH_PATTERNS)
+        ):
+            return None
+        
+        # Brute-force search space stands in for zxcvbn's guess estimate
+        guesses = entropy_result['total_combinations']
+        if guesses == math.inf:
+            guesses = 2 ** FAST_PATH_STRONG_BITS
+        estimates = estimate_attack_times(guesses)
+        # Tiny search spaces are fixed at the lowest score, as zxcvbn's
+        # dictionary/sequence matchers would only find them cheaper
+        score = estimates['score'] if entropy_bits > FAST_PATH_STRONG_BITS else 0
+        feedback = {'warning': '', 'suggestions': []}
+        # Recommendations follow the verdict even when entropy isn't reported
+        recommendations = self._generate_recommendations(
+            {'feedback': feedback},
+            patterns,
+            contextual_matches,
+            entropy_result
+        )
+        
+        return {
+            'password_length': len(password),
+            'zxcvbn_score': score,
+            'zxcvbn_feedback': feedback,
+            'guesses': guesses,
+            'crack_times_display': estimates['crack_times_display'],
+            'patterns_detected': patterns,
+            'contextual_matches': contextual_matches,
+            'has_contextual_risk': len(contextual_matches) > 0,
+            'entropy': entropy_result if use_entropy else None,
+            'recommendations': recommendations,
+            'overall_risk': self._calculate_risk_level(
+                score,
+                contextual_matches,
+                patterns
+            )
+        }
+    
+    def _check_contextual_items(self, password: str, user_inputs: Sequence[str]) -> List[str]:
         """Check if password contains any user-provided contextual items."""
-        matches = []
+        # Only meaningful items (3+ chars) are checked; lowercased once per input set
+        items, needles = _contextual_needles(tuple(user_inputs))
+        if not needles:
+            return []
+        
         password_lower = password.lower()
         
-        for item in user_inputs:
-            if item and len(item) >= 3:  # Only check meaningful items
-                if item.lower() in password_lower:
-                    matches.append(item)
+        if ahocorasick is not None:
+            # Single pass over the password finds every matching item
+            automaton = _build_contextual_automaton(needles)
+            found = {needle for _, needle in automaton.iter(password_lower)}
+            return [item for item, lowered in items if lowered in found]
         
-        return matches
+        return [item for item, lowered in items if lowered in password_lower]
     
     def _generate_recommendations(
         self,
@@ -190,7 +409,9 @@ class PasswordAnalyzer:
     def batch_analyze(
         self,
         passwords: List[str],
-        user_inputs: Optional[List[str]] = None
+        user_inputs: Optional[List[str]] = None,
+        workers: Optional[int] = None,
+        fast: bool = False
     ) -> List[Dict[str, Any]]:
         """
         Analyze multiple passwords.
@@ -198,14 +419,150 @@ class PasswordAnalyzer:
         Args:
             passwords: List of passwords to analyze
             user_inputs: Optional user context
+            workers: Worker processes for large batches (default: usable CPUs, 1 disables)
+            fast: Triage obvious extremes (entropy, character classes, patterns) without zxcvbn
             
         Returns:
             List of analysis results
         """
-        results = []
-        for pwd in passwords:
-            result = self.analyze(pwd, user_inputs=user_inputs)
-            results.append(result)
+        # Build the context tuple once; analyze() and the cache reuse it as-is
+        user_inputs = tuple(user_inputs or ())
+        workers = workers or _default_workers()
+        
+        # Analyze each distinct password once; leak files repeat the same few a lot
+        unique_passwords = list(dict.fromkeys(passwords))
+        
+        if workers > 1 and len(unique_passwords) >= PARALLEL_BATCH_THRESHOLD:
+            # zxcvbn is pure Python and CPU-bound, so fan out across processes
+            chunksize = max(1, len(unique_passwords) // (workers * 4))
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(WORKER_MEMORY_LIMIT,)
+            ) as executor:
+                unique_results = list(executor.map(
+                    _analyze_one,
+                    unique_passwords,
+                    itertools.repeat(user_inputs),
+                    itertools.repeat(fast),
+                    chunksize=chunksize
+                ))
+        else:
+            unique_results = [
+                self.analyze(pwd, user_inputs=user_inputs, fast=fast) for pwd in unique_passwords
+            ]
+        
+        if len(unique_passwords) == len(passwords):
+            results = unique_results
+        else:
+            # Expand back to input order; each duplicate gets its own dict
+            by_password = dict(zip(unique_passwords, unique_results))
+            results = [copy.copy(by_password[pwd]) for pwd in passwords]
         
         logger.info(f"Batch analyzed {len(passwords)} passwords")
         return results
+    
+    def batch_analyze_iter(
+        self,
+        passwords: Iterable[str],
+        user_inputs: Optional[List[str]] = None,
+        workers: Optional[int] = None,
+        fast: bool = False,
+        mp_context=None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Analyze passwords lazily, yielding results in input order.
+        
+        Unlike batch_analyze, the input is never materialized as a list:
+        only a bounded window is read ahead, so reading (e.g. from a file)
+        overlaps with analysis and memory stays flat for huge inputs.
+        Recently seen passwords are analyzed once; each repeat still gets
+        its own result dict.
+        
+        Args:
+            passwords: Iterable of passwords to analyze
+            user_inputs: Optional user context
+            workers: Worker processes (default: usable CPUs, 1 disables)
+            fast: Triage obvious extremes (entropy, character classes, patterns) without zxcvbn
+            mp_context: multiprocessing context for the worker pool (default: platform's)
+            
+        Yields:
+            Analysis result for each password
+        """
+        user_inputs = tuple(user_inputs or ())
+        workers = workers or _default_workers()
+        passwords = iter(passwords)
+        
+        # Small inputs aren't worth starting a process pool
+        head = list(itertools.islice(passwords, PARALLEL_BATCH_THRESHOLD))
+        
+        if workers > 1 and len(head) >= PARALLEL_BATCH_THRESHOLD:
+            remaining = itertools.chain(head, passwords)
+            chunks = iter(lambda: list(itertools.islice(remaining, STREAM_CHUNKSIZE)), [])
+            max_pending = workers * STREAM_PREFETCH
+            
+            # Each input password gets a one-item result slot, shared by its
+            # duplicates; recently seen passwords map to their slot so each
+            # distinct password is sent to the workers once. Evicting from
+            # this map only costs a re-analysis, never an output.
+            slots_by_password = collections.OrderedDict()
+            # Slots in input order, yielded as soon as the front one is filled
+            unreported = collections.deque()
+            
+            def ready():
+                while unreported and unreported[0][0] is not None:
+                    yield copy.copy(unreported.popleft()[0])
+            
+            def fill(task):
+                future, slots = task
+                for slot, result in zip(slots, future.result()):
+                    slot[0] = result
+            
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=mp_context,
+                initializer=_init_worker,
+                initargs=(WORKER_MEMORY_LIMIT,)
+            ) as executor:
+                # executor.map would consume the whole input up front
+                pending = collections.deque()
+                try:
+                    for chunk in chunks:
+                        new_passwords = []
+                        new_slots = []
+                        for pwd in chunk:
+                            slot = slots_by_password.get(pwd)
+                            if slot is None:
+                                slot = slots_by_password[pwd] = [None]
+                                new_passwords.append(pwd)
+                                new_slots.append(slot)
+                                if len(slots_by_password) > ANALYSIS_CACHE_SIZE:
+                                    slots_by_password.popitem(last=False)
+                            else:
+                                slots_by_password.move_to_end(pwd)
+                            unreported.append(slot)
+                        
+                        if new_passwords:
+                            pending.append((
+                                executor.submit(_analyze_chunk, new_passwords, user_inputs, fast),
+                                new_slots
+                            ))
+                        # Duplicate-only chunks submit nothing, so also bound
+                        # the results waiting on an earlier chunk
+                        while pending and (
+                            len(pending) >= max_pending
+                            or len(unreported) >= max_pending * STREAM_CHUNKSIZE
+                        ):
+                            fill(pending.popleft())
+                        yield from ready()
+                    while pending:
+                        fill(pending.popleft())
+                        yield from ready()
+                finally:
+                    # Closed early: drop chunks that haven't started
+                    for future, _ in pending:
+                        future.cancel()
+        else:
+            # Duplicates are served from analyze()'s own cache
+            for pwd in itertools.chain(head, passwords):
+                yield self.analyze(pwd, user_inputs=user_inputs, fast=fast)
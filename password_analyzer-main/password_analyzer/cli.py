@@ -4,14 +4,20 @@ CLI interface for Password Strength Analyzer.
 """
 
 import argparse
+import os
 import sys
 import logging
+import mmap
+from collections import Counter
 from pathlib import Path
-from typing import List
+from typing import Iterator, List
 
 from password_analyzer import PasswordAnalyzer, WordlistGenerator
 from password_analyzer.eula import EULAManager
 
+# Passwords per buffered write when exporting batch results
+EXPORT_CHUNK_SIZE = 1000
+
 
 def setup_logging(verbose: bool = False):
     """Configure logging."""
@@ -24,60 +30,65 @@ def setup_logging(verbose: bool = False):
 
 def print_analysis_result(result: dict, verbose: bool = False):
     """Print password analysis result in a readable format."""
-    print("\n" + "="*80)
-    print("PASSWORD ANALYSIS REPORT")
-    print("="*80)
+    # Collect lines and write once instead of one print() per line
+    lines = []
+    
+    lines.append("\n" + "="*80)
+    lines.append("PASSWORD ANALYSIS REPORT")
+    lines.append("="*80)
     
     # Basic info
-    print(f"\n📊 Overall Risk Level: {result['overall_risk']}")
-    print(f"🔢 Password Length: {result['password_length']} characters")
-    print(f"⭐ zxcvbn Score: {result['zxcvbn_score']}/4")
+    lines.append(f"\n📊 Overall Risk Level: {result['overall_risk']}")
+    lines.append(f"🔢 Password Length: {result['password_length']} characters")
+    lines.append(f"⭐ zxcvbn Score: {result['zxcvbn_score']}/4")
     
     # Critical warnings
     if result['has_contextual_risk']:
-        print(f"\n🚨 CRITICAL WARNING: Password contains personal information!")
-        print(f"   Matched items: {', '.join(result['contextual_matches'])}")
+        lines.append(f"\n🚨 CRITICAL WARNING: Password contains personal information!")
+        lines.append(f"   Matched items: {', '.join(result['contextual_matches'])}")
     
     # Crack time estimates
-    print(f"\n⏱️  Estimated Crack Times:")
+    lines.append(f"\n⏱️  Estimated Crack Times:")
     crack_times = result['crack_times_display']
-    print(f"   Online (throttled): {crack_times.get('online_throttling', 'N/A')}")
-    print(f"   Online (no throttle): {crack_times.get('online_no_throttling', 'N/A')}")
-    print(f"   Offline (slow hash): {crack_times.get('offline_slow_hashing_1e4_per_second', 'N/A')}")
-    print(f"   Offline (fast hash): {crack_times.get('offline_fast_hashing_1e10_per_second', 'N/A')}")
+    lines.append(f"   Online (throttled): {crack_times.get('online_throttling', 'N/A')}")
+    lines.append(f"   Online (no throttle): {crack_times.get('online_no_throttling', 'N/A')}")
+    lines.append(f"   Offline (slow hash): {crack_times.get('offline_slow_hashing_1e4_per_second', 'N/A')}")
+    lines.append(f"   Offline (fast hash): {crack_times.get('offline_fast_hashing_1e10_per_second', 'N/A')}")
     
     # Entropy information
     if result['entropy'] and verbose:
-        print(f"\n🔐 Entropy Analysis:")
-        print(f"   Entropy: {result['entropy']['entropy_bits']:.1f} bits")
-        print(f"   Character Pool: {result['entropy']['pool_size']}")
-        print(f"   Strength Rating: {result['entropy']['strength_rating']}")
+        lines.append(f"\n🔐 Entropy Analysis:")
+        lines.append(f"   Entropy: {result['entropy']['entropy_bits']:.1f} bits")
+        lines.append(f"   Character Pool: {result['entropy']['pool_size']}")
+        lines.append(f"   Strength Rating: {result['entropy']['strength_rating']}")
     
     # Pattern detection
     if verbose:
         patterns = result['patterns_detected']
         if any(patterns.values()):
-            print(f"\n🔍 Detected Patterns:")
+            lines.append(f"\n🔍 Detected Patterns:")
             if patterns['repeated_sequences']:
-                print(f"   - Repeated sequences: {patterns['repeated_sequences']}")
+                lines.append(f"   - Repeated sequences: {patterns['repeated_sequences']}")
             if patterns['keyboard_patterns']:
-                print(f"   - Keyboard patterns: {patterns['keyboard_patterns']}")
+                lines.append(f"   - Keyboard patterns: {patterns['keyboard_patterns']}")
             if patterns['dates']:
-                print(f"   - Date patterns: {patterns['dates']}")
+                lines.append(f"   - Date patterns: {patterns['dates']}")
             if patterns['sequential']:
-                print(f"   - Sequential patterns: {patterns['sequential']}")
+                lines.append(f"   - Sequential patterns: {patterns['sequential']}")
             if patterns['leet_speak']:
-                print(f"   - Leet speak detected: Yes")
+                lines.append(f"   - Leet speak detected: Yes")
     
     # Recommendations
-    print(f"\n💡 Recommendations:")
+    lines.append(f"\n💡 Recommendations:")
     for rec in result['recommendations']:
-        print(f"   {rec}")
+        lines.append(f"   {rec}")
     
-    print("\n" + "="*80 + "\n")
+    lines.append("\n" + "="*80 + "\n")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
-def analyze_password_command(args):
+def analyze_password_command(args, eula: EULAManager):
     """Handle single password analysis."""
     analyzer = PasswordAnalyzer()
     
@@ -90,75 +101,140 @@ def analyze_password_command(args):
     print_analysis_result(result, verbose=args.verbose)
 
 
-def batch_analyze_command(args):
+def _iter_passwords(path: str) -> Iterator[str]:
+    """Yield passwords from a file, one per line, skipping blanks and comments."""
+    with open(path, 'rb') as f:
+        # mmap can't map an empty file
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        
+        # The OS pages the file in; only each line's bytes are copied out
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            size = len(mm)
+            start = 0
+            while start < size:
+                end = mm.find(b'\n', start)
+                if end == -1:
+                    end = size
+                password = mm[start:end].decode('utf-8').strip()
+                start = end + 1
+                if password and not password.startswith('#'):
+                    yield password
+
+
+def batch_analyze_command(args, eula: EULAManager):
     """Handle batch password analysis from file."""
-    if not Path(args.file).exists():
+    if not os.path.exists(args.file):
         print(f"❌ Error: File not found: {args.file}")
         sys.exit(1)
     
-    # Read passwords (filter out comments)
+    print(f"📁 Analyzing passwords from {args.file}...")
+    
+    analyzer = PasswordAnalyzer()
+    
+    # The export is written while results stream in, so memory stays flat
+    export = None
+    export_error = None
+    if args.output:
+        try:
+            export = open(args.output, 'w', encoding='utf-8')
+        except OSError as e:
+            export_error = e
+    
+    chunks = [
+        "Password Strength Analysis Report\n"
+        f"Generated: {Path(args.file).name}\n"
+        + "="*80 + "\n\n"
+    ]
+    
+    def flush_export():
+        nonlocal export, export_error
+        if export is not None:
+            try:
+                export.write(''.join(chunks))
+            except OSError as e:
+                export_error = e
+                export.close()
+                export = None
+        chunks.clear()
+    
+    risk_counts = Counter()
+    # Only kept when the detailed listing needs them after the summary
+    verbose_results = []
+    total = 0
+    
+    # Passwords are streamed from the file straight into the analyzer
+    completed = False
     try:
-        with open(args.file, 'r', encoding='utf-8') as f:
-            passwords = [line.strip() for line in f if line.strip() and not line.strip().startswith('#')]
-    except Exception as e:
+        results = analyzer.batch_analyze_iter(
+            _iter_passwords(args.file),
+            user_inputs=args.user_inputs,
+            workers=args.workers,
+            fast=args.fast
+        )
+        for total, result in enumerate(results, 1):
+            risk_counts[result['overall_risk']] += 1
+            if args.verbose:
+                verbose_results.append(result)
+            
+            # One string per password, written out EXPORT_CHUNK_SIZE at a time
+            if export is not None:
+                if result['has_contextual_risk']:
+                    extra = f"  ⚠️  Contains personal info: {result['contextual_matches']}\n"
+                else:
+                    extra = ""
+                chunks.append(
+                    f"Password #{total}:\n"
+                    f"  Score: {result['zxcvbn_score']}/4\n"
+                    f"  Risk: {result['overall_risk']}\n"
+                    f"  Length: {result['password_length']}\n"
+                    f"{extra}\n"
+                )
+                if total % EXPORT_CHUNK_SIZE == 0:
+                    flush_export()
+        completed = True
+    except (OSError, UnicodeDecodeError) as e:
         print(f"❌ Error reading file: {e}")
         sys.exit(1)
+    finally:
+        if not completed and export is not None:
+            # Read errors, worker crashes, interrupts: don't leave a partial report behind
+            export.close()
+            os.remove(args.output)
     
-    print(f"📁 Analyzing {len(passwords)} passwords from {args.file}...")
+    flush_export()
+    if export is not None:
+        export.close()
     
-    analyzer = PasswordAnalyzer()
-    results = analyzer.batch_analyze(passwords, user_inputs=args.user_inputs)
-    
-    # Summary statistics
-    risk_counts = {}
-    for result in results:
-        risk = result['overall_risk']
-        risk_counts[risk] = risk_counts.get(risk, 0) + 1
+    # Summary statistics, most common risk level first
+    inv = 100.0 / total if total else 0.0
     
     print("\n" + "="*80)
     print("BATCH ANALYSIS SUMMARY")
     print("="*80)
-    print(f"Total passwords analyzed: {len(results)}")
+    print(f"Total passwords analyzed: {total}")
     print(f"\nRisk Distribution:")
-    for risk, count in sorted(risk_counts.items()):
-        print(f"  {risk}: {count} ({count/len(results)*100:.1f}%)")
+    for risk, count in risk_counts.most_common():
+        print(f"  {risk}: {count} ({count*inv:.1f}%)")
     
     # Detailed results if verbose
     if args.verbose:
         print("\n" + "="*80)
         print("DETAILED RESULTS")
         print("="*80)
-        for i, result in enumerate(results, 1):
+        for i, result in enumerate(verbose_results, 1):
             print(f"\nPassword #{i}:")
             print_analysis_result(result, verbose=False)
     
-    # Export results if requested
-    if args.output:
-        try:
-            with open(args.output, 'w', encoding='utf-8') as f:
-                f.write("Password Strength Analysis Report\n")
-                f.write(f"Generated: {Path(args.file).name}\n")
-                f.write("="*80 + "\n\n")
-                
-                for i, result in enumerate(results, 1):
-                    f.write(f"Password #{i}:\n")
-                    f.write(f"  Score: {result['zxcvbn_score']}/4\n")
-                    f.write(f"  Risk: {result['overall_risk']}\n")
-                    f.write(f"  Length: {result['password_length']}\n")
-                    if result['has_contextual_risk']:
-                        f.write(f"  ⚠️  Contains personal info: {result['contextual_matches']}\n")
-                    f.write("\n")
-            
-            print(f"\n✅ Results exported to: {args.output}")
-        
-        except Exception as e:
-            print(f"❌ Error exporting results: {e}")
+    # Report the export outcome after the summary, as before
+    if export_error is not None:
+        print(f"❌ Error exporting results: {export_error}")
+    elif args.output:
+        print(f"\n✅ Results exported to: {args.output}")
 
 
-def generate_wordlist_command(args):
+def generate_wordlist_command(args, eula: EULAManager):
     """Handle educational wordlist generation."""
-    eula = EULAManager()
-    
     # Check for authorization
     if not args.confirm_authorized:
         print(eula.get_export_warning())
@@ -255,6 +331,17 @@ def main():
         '--output',
         help='Export results to file'
     )
+    batch_parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Worker processes for analysis (default: usable CPUs, 1 disables)'
+    )
+    batch_parser.add_argument(
+        '--fast',
+        action='store_true',
+        help='Triage clearly weak/strong passwords without zxcvbn'
+    )
     
     # Generate wordlist command
     wordlist_parser = subparsers.add_parser(
@@ -286,11 +373,12 @@ def main():
     
     # Setup
     setup_logging(args.verbose)
+    # One manager per run, shared by every command
     eula = EULAManager()
     
     # Check EULA acceptance
     if not eula.check_eula_accepted():
-        print(eula.get_eula_text())
+        sys.stdout.write(eula.get_eula_text())
         response = input("\nDo you accept these terms? (yes/no): ").strip().lower()
         
         if response != 'yes':
@@ -306,15 +394,15 @@ def main():
     # Route to appropriate command
     if args.command == 'analyze':
         eula.log_action("Password analysis", f"Length: {len(args.password)}")
-        analyze_password_command(args)
+        analyze_password_command(args, eula)
     
     elif args.command == 'batch':
         eula.log_action("Batch analysis", f"File: {args.file}")
-        batch_analyze_command(args)
+        batch_analyze_command(args, eula)
     
     elif args.command == 'generate-wordlist':
         if args.export:
-            generate_wordlist_command(args)
+            generate_wordlist_command(args, eula)
         else:
             print("❌ Error: --export flag required for wordlist generation")
             sys.exit(1)
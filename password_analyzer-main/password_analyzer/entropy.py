@@ -2,9 +2,71 @@
 Custom entropy calculator with time-to-crack estimates.
 """
 
+import bisect
 import math
 import string
-from typing import Dict
+from typing import Dict, List
+
+try:
+    import numpy as np
+except ImportError:  # Optional: calculate_batch falls back to per-password calculate
+    np = None
+
+try:
+    from .entropy_numba import class_masks as _numba_class_masks
+except ImportError:  # Optional: NumPy classification is used instead
+    _numba_class_masks = None
+
+# Character classes as frozensets for O(1) membership tests
+_LOWER = frozenset(string.ascii_lowercase)
+_UPPER = frozenset(string.ascii_uppercase)
+_DIGITS = frozenset(string.digits)
+_PUNCT = frozenset(string.punctuation)
+
+# Class bits used by the single-pass pool size scan
+_HAS_LOWER = 1
+_HAS_UPPER = 2
+_HAS_DIGIT = 4
+_HAS_SPECIAL = 8
+_HAS_SPACE = 16
+_ALL_CLASSES = 31
+
+
+def _build_class_lut():
+    """Map each ASCII code point to its class bit (0 for unclassified)."""
+    lut = np.zeros(128, dtype=np.uint8)
+    for chars, bit in (
+        (string.ascii_lowercase, _HAS_LOWER),
+        (string.ascii_uppercase, _HAS_UPPER),
+        (string.digits, _HAS_DIGIT),
+        (string.punctuation, _HAS_SPECIAL),
+        (' ', _HAS_SPACE),
+    ):
+        lut[[ord(c) for c in chars]] = bit
+    return lut
+
+
+_CLASS_LUT = _build_class_lut() if np is not None else None
+
+# Search spaces at or above 2**1023 overflow a float; every scenario then
+# reports "centuries+" without building the big integer
+_MAX_FLOAT_BITS = 1023
+
+# Pool contribution of each character class bit
+_CLASS_POOL_SIZES = (
+    (_HAS_LOWER, 26),
+    (_HAS_UPPER, 26),
+    (_HAS_DIGIT, 10),
+    (_HAS_SPECIAL, len(string.punctuation)),
+    (_HAS_SPACE, 1),
+)
+
+# Pool size for every class mask, and log2 of every achievable pool size
+_POOL_BY_MASK = tuple(
+    max(1, sum(size for bit, size in _CLASS_POOL_SIZES if mask & bit))
+    for mask in range(_ALL_CLASSES + 1)
+)
+_LOG2_POOL = {n: math.log2(n) for n in set(_POOL_BY_MASK)}
 
 
 class EntropyCalculator:
@@ -20,6 +82,20 @@ class EntropyCalculator:
         'offline_fast': 100_000_000_000,  # 100B guesses/sec (MD5, SHA1 on GPU farm)
     }
     
+    # Exclusive upper bound (seconds) of each display unit, and the
+    # (divisor, format) used for durations below it
+    _TIME_THRESHOLDS = (1, 60, 3600, 86400, 31536000, 3153600000, 31536000000)
+    _TIME_FORMATS = (
+        (1, "instant"),
+        (1, "{:.0f} seconds"),
+        (60, "{:.0f} minutes"),
+        (3600, "{:.1f} hours"),
+        (86400, "{:.1f} days"),
+        (31536000, "{:.1f} years"),
+        (3153600000, "{:.1f} centuries"),
+        (1, "centuries+"),
+    )
+    
     def calculate(self, password: str) -> Dict:
         """
         Calculate entropy and time-to-crack estimates.
@@ -36,11 +112,63 @@ class EntropyCalculator:
         # Determine character pool size
         pool_size = self._calculate_pool_size(password)
         
+        return self._build_result(len(password), pool_size)
+    
+    def calculate_batch(self, passwords: List[str]) -> List[Dict]:
+        """
+        Calculate entropy for many passwords at once.
+        
+        Character classification runs in a compiled Numba kernel or with
+        vectorized NumPy when available; results are identical to calling
+        calculate() on each password.
+        
+        Args:
+            passwords: The passwords to analyze
+            
+        Returns:
+            List of entropy result dictionaries, in input order
+        """
+        non_empty = [p for p in passwords if p]
+        if np is None or not non_empty:
+            return [self.calculate(p) for p in passwords]
+        
+        # UTF-32 keeps one array element per character, so offsets match len()
+        codes = np.frombuffer(''.join(non_empty).encode('utf-32-le'), dtype=np.uint32)
+        lengths = np.fromiter((len(p) for p in non_empty), dtype=np.int64, count=len(non_empty))
+        offsets = np.zeros(len(non_empty), dtype=np.int64)
+        np.cumsum(lengths[:-1], out=offsets[1:])
+        
+        if _numba_class_masks is not None:
+            masks = _numba_class_masks(codes, offsets, lengths, _CLASS_LUT, _ALL_CLASSES)
+        else:
+            # Non-ASCII characters don't belong to any class
+            bits = np.where(codes < 128, _CLASS_LUT[np.minimum(codes, 127)], 0).astype(np.uint8)
+            masks = np.bitwise_or.reduceat(bits, offsets)
+        
+        mask_iter = iter(masks.tolist())
+        
+        return [
+            self._build_result(len(p), _POOL_BY_MASK[next(mask_iter)]) if p
+            else {'entropy_bits': 0, 'pool_size': 0}
+            for p in passwords
+        ]
+    
+    def _build_result(self, length: int, pool_size: int) -> Dict:
+        """Build the entropy result for a password of the given length and pool."""
         # Calculate entropy in bits
-        entropy_bits = len(password) * math.log2(pool_size)
+        entropy_bits = length * _LOG2_POOL[pool_size]
+        
+        if entropy_bits >= _MAX_FLOAT_BITS:
+            return {
+                'entropy_bits': entropy_bits,
+                'pool_size': pool_size,
+                'total_combinations': math.inf,
+                'crack_times': {scenario: "centuries+" for scenario in self.ATTACK_SCENARIOS},
+                'strength_rating': self._rate_entropy(entropy_bits)
+            }
         
         # Calculate number of possible combinations
-        combinations = pool_size ** len(password)
+        combinations = pool_size ** length
         
         # Estimate time to crack under different scenarios
         crack_times = {}
@@ -58,45 +186,35 @@ class EntropyCalculator:
     
     def _calculate_pool_size(self, password: str) -> int:
         """Determine the character pool size based on what's used."""
-        pool_size = 0
+        mask = 0
         
-        has_lowercase = any(c in string.ascii_lowercase for c in password)
-        has_uppercase = any(c in string.ascii_uppercase for c in password)
-        has_digits = any(c in string.digits for c in password)
-        has_special = any(c in string.punctuation for c in password)
-        has_space = ' ' in password
+        # One pass over the password, stopping once every class has been seen
+        for c in password:
+            if c in _LOWER:
+                mask |= _HAS_LOWER
+            elif c in _UPPER:
+                mask |= _HAS_UPPER
+            elif c in _DIGITS:
+                mask |= _HAS_DIGIT
+            elif c in _PUNCT:
+                mask |= _HAS_SPECIAL
+            elif c == ' ':
+                mask |= _HAS_SPACE
+            else:
+                continue
+            if mask == _ALL_CLASSES:
+                break
         
-        if has_lowercase:
-            pool_size += 26
-        if has_uppercase:
-            pool_size += 26
-        if has_digits:
-            pool_size += 10
-        if has_special:
-            pool_size += len(string.punctuation)
-        if has_space:
-            pool_size += 1
-        
-        return pool_size if pool_size > 0 else 1
+        return self._pool_size_from_mask(mask)
+    
+    def _pool_size_from_mask(self, mask: int) -> int:
+        """Sum the pool contributions of the character classes in a mask."""
+        return _POOL_BY_MASK[mask]
     
     def _format_time(self, seconds: float) -> str:
         """Format time duration in human-readable format."""
-        if seconds < 1:
-            return "instant"
-        elif seconds < 60:
-            return f"{seconds:.0f} seconds"
-        elif seconds < 3600:
-            return f"{seconds/60:.0f} minutes"
-        elif seconds < 86400:
-            return f"{seconds/3600:.1f} hours"
-        elif seconds < 31536000:
-            return f"{seconds/86400:.1f} days"
-        elif seconds < 3153600000:
-            return f"{seconds/31536000:.1f} years"
-        elif seconds < 31536000000:
-            return f"{seconds/31536000/100:.1f} centuries"
-        else:
-            return "centuries+"
+        divisor, fmt = self._TIME_FORMATS[bisect.bisect_right(self._TIME_THRESHOLDS, seconds)]
+        return fmt.format(seconds / divisor)
     
     def _rate_entropy(self, entropy_bits: float) -> str:
         """Rate password strength based on entropy."""
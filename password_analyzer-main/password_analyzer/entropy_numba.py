@@ -0,0 +1,40 @@
+"""
+Numba-compiled character classification for batch entropy calculation.
+
+Importing this module raises ImportError when numba/numpy aren't installed;
+EntropyCalculator then falls back to the NumPy or pure-Python paths.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+
+@njit(parallel=True, cache=True)
+def class_masks(codes, offsets, lengths, class_lut, all_classes):
+    """
+    Compute the character-class bitmask of every password in a batch.
+    
+    Args:
+        codes: Code points of all passwords concatenated
+        offsets: Start index of each password in codes
+        lengths: Length of each password
+        class_lut: Class bit for each ASCII code point (0 if unclassified)
+        all_classes: Mask value once every class has been seen
+        
+    Returns:
+        uint8 array with one class mask per password
+    """
+    count = offsets.shape[0]
+    masks = np.zeros(count, dtype=np.uint8)
+    
+    for i in prange(count):
+        mask = 0
+        for j in range(offsets[i], offsets[i] + lengths[i]):
+            code = codes[j]
+            if code < 128:
+                mask |= class_lut[code]
+                if mask == all_classes:
+                    break
+        masks[i] = mask
+    
+    return masks
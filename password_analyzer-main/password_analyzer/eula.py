@@ -3,36 +3,36 @@ EULA and safety/ethics enforcement.
 """
 
 import os
+import time
+import atexit
 import logging
 from pathlib import Path
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Resolved once per process; Path.home() consults the environment each call
+_HOME = Path.home()
 
-class EULAManager:
-    """
-    Manages end-user license agreement and ethical use confirmations.
-    """
-    
-    def __init__(self, config_dir: str = None):
-        """Initialize EULA manager with config directory."""
-        if config_dir is None:
-            config_dir = os.path.join(Path.home(), '.password_analyzer')
-        
-        self.config_dir = Path(config_dir)
-        self.config_dir.mkdir(exist_ok=True)
-        
-        self.eula_file = self.config_dir / 'eula_accepted.txt'
-        self.log_file = self.config_dir / 'usage.log'
-    
-    def check_eula_accepted(self) -> bool:
-        """Check if user has accepted EULA."""
-        return self.eula_file.exists()
+# (epoch second, formatted local date/time) reused by entries within a second
+_ts_cache = (None, "")
+
+
+def _local_isoformat() -> str:
+    """Local timestamp matching datetime.now().isoformat(), cached per second."""
+    global _ts_cache
+    now = time.time()
+    second = int(now)
+    cached_second, prefix = _ts_cache
+    if cached_second != second:
+        prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(second))
+        _ts_cache = (second, prefix)
     
-    def get_eula_text(self) -> str:
-        """Get the full EULA text."""
-        return """
+    microsecond = int((now - second) * 1_000_000)
+    return f"{prefix}.{microsecond:06d}" if microsecond else prefix
+
+
+_EULA_TEXT = """
 ================================================================================
         PASSWORD STRENGTH ANALYZER - END USER LICENSE AGREEMENT
 ================================================================================
@@ -81,6 +81,53 @@ EDUCATION, and AUTHORIZED TESTING purposes only.
 
 ================================================================================
 """
+
+_EXPORT_WARNING = """
+⚠️  WORDLIST EXPORT CONFIRMATION REQUIRED ⚠️
+
+You are about to export an educational wordlist.
+
+IMPORTANT REMINDERS:
+• This wordlist is for YOUR OWN password analysis and education
+• Using this for unauthorized access attempts is ILLEGAL
+• You must have proper authorization for any security testing
+• Distributing this for malicious purposes violates the EULA
+
+This action will be logged.
+
+Do you confirm you will use this wordlist ONLY for authorized purposes?
+"""
+
+
+class EULAManager:
+    """
+    Manages end-user license agreement and ethical use confirmations.
+    """
+    
+    def __init__(self, config_dir: str = None):
+        """Initialize EULA manager with config directory."""
+        if config_dir is None:
+            config_dir = os.path.join(_HOME, '.password_analyzer')
+        
+        self.config_dir = Path(config_dir)
+        # Skip the mkdir syscall once the directory exists
+        if not self.config_dir.exists():
+            self.config_dir.mkdir(exist_ok=True)
+        
+        self.eula_file = self.config_dir / 'eula_accepted.txt'
+        self.log_file = self.config_dir / 'usage.log'
+        
+        # Opened lazily on first log_action and kept open for later entries
+        self._log_fh = None
+    
+    def check_eula_accepted(self) -> bool:
+        """Check if user has accepted EULA."""
+        return self.eula_file.exists()
+    
+    @staticmethod
+    def get_eula_text() -> str:
+        """Get the full EULA text."""
+        return _EULA_TEXT
     
     def accept_eula(self) -> bool:
         """Record EULA acceptance."""
@@ -100,33 +147,31 @@ EDUCATION, and AUTHORIZED TESTING purposes only.
     def log_action(self, action: str, details: str = ""):
         """Log user actions for audit trail."""
         try:
-            with open(self.log_file, 'a') as f:
-                timestamp = datetime.now().isoformat()
-                log_entry = f"{timestamp} | {action}"
-                if details:
-                    log_entry += f" | {details}"
-                f.write(log_entry + "\n")
+            if self._log_fh is None:
+                # Line-buffered: one write per entry, no open/close per call
+                self._log_fh = open(self.log_file, 'a', buffering=1)
+                atexit.register(self.close)
+            
+            timestamp = _local_isoformat()
+            log_entry = f"{timestamp} | {action}"
+            if details:
+                log_entry += f" | {details}"
+            self._log_fh.write(log_entry + "\n")
         
         except Exception as e:
             logger.error(f"Failed to log action: {e}")
     
-    def get_export_warning(self) -> str:
+    def close(self):
+        """Close the audit log file handle, if open."""
+        if self._log_fh is not None:
+            self._log_fh.close()
+            self._log_fh = None
+            atexit.unregister(self.close)
+    
+    @staticmethod
+    def get_export_warning() -> str:
         """Get warning text for wordlist export."""
-        return """
-⚠️  WORDLIST EXPORT CONFIRMATION REQUIRED ⚠️
-
-You are about to export an educational wordlist.
-
-IMPORTANT REMINDERS:
-• This wordlist is for YOUR OWN password analysis and education
-• Using this for unauthorized access attempts is ILLEGAL
-• You must have proper authorization for any security testing
-• Distributing this for malicious purposes violates the EULA
-
-This action will be logged.
-
-Do you confirm you will use this wordlist ONLY for authorized purposes?
-"""
+        return _EXPORT_WARNING
     
     def confirm_export_cli(self) -> bool:
         """
@@ -6,13 +6,33 @@ GUI interface for Password Strength Analyzer using tkinter.
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox, filedialog
 from typing import List
+import collections
 import logging
+import multiprocessing
+import os
+import queue
+import threading
 
 from password_analyzer import PasswordAnalyzer, WordlistGenerator
 from password_analyzer.eula import EULAManager
 
 logger = logging.getLogger(__name__)
 
+# How often (ms) the Tk loop polls for batch results, and how many it
+# renders per poll so a fast worker can't starve the event loop
+BATCH_POLL_MS = 50
+BATCH_DRAIN_LIMIT = 200
+
+# Read buffer for batch password files
+BATCH_READ_BUFFER = 1 << 20
+
+# Batch pool workers are spawned, not forked: forking a process with a
+# running Tk loop and other threads can deadlock the children
+_POOL_CONTEXT = multiprocessing.get_context('spawn')
+
+# Posted by the batch worker after its last result
+_BATCH_DONE = object()
+
 
 class PasswordAnalyzerGUI:
     """
@@ -28,6 +48,18 @@ class PasswordAnalyzerGUI:
         self.generator = WordlistGenerator()
         self.eula = EULAManager()
         
+        # Batch analysis runs on a worker thread; results come back through
+        # this queue and are rendered from the Tk loop
+        self._result_queue = queue.Queue()
+        self._batch_cancel = threading.Event()
+        self._batch_results = []
+        self._batch_bytes_read = 0
+        self._batch_error = None
+        
+        # Wordlist generation also runs off the Tk thread; its single result
+        # is handed back through this queue
+        self._wordlist_queue = queue.Queue()
+        
         # Check EULA on startup
         if not self.eula.check_eula_accepted():
             self.show_eula_dialog()
@@ -208,23 +240,60 @@ class PasswordAnalyzerGUI:
         self.batch_user_inputs = ttk.Entry(user_input_frame, width=70)
         self.batch_user_inputs.pack(fill=tk.X, pady=5)
         
-        # Analyze button
-        ttk.Button(
-            self.batch_tab,
+        # Analyze/cancel buttons and progress
+        button_frame = ttk.Frame(self.batch_tab)
+        button_frame.pack(pady=10)
+        
+        self.batch_button = ttk.Button(
+            button_frame,
             text="Analyze Batch",
             command=self.analyze_batch
-        ).pack(pady=10)
+        )
+        self.batch_button.pack(side=tk.LEFT, padx=5)
+        
+        self.batch_cancel_button = ttk.Button(
+            button_frame,
+            text="Cancel",
+            command=self.cancel_batch,
+            state=tk.DISABLED
+        )
+        self.batch_cancel_button.pack(side=tk.LEFT, padx=5)
+        
+        self.batch_progress = ttk.Progressbar(self.batch_tab, mode='determinate')
+        self.batch_progress.pack(fill=tk.X, padx=10)
         
         # Results
         results_frame = ttk.LabelFrame(self.batch_tab, text="Batch Results", padding=10)
         results_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
         
-        self.batch_results_text = scrolledtext.ScrolledText(
+        self.batch_summary_label = ttk.Label(
             results_frame,
-            wrap=tk.WORD,
+            text="",
+            justify=tk.LEFT,
             font=("Courier", 9)
         )
-        self.batch_results_text.pack(fill=tk.BOTH, expand=True)
+        self.batch_summary_label.pack(anchor=tk.W, pady=(0, 5))
+        
+        # Treeview only draws the visible rows, so large batches stay fast
+        columns = ('index', 'score', 'risk', 'contains')
+        self.batch_results_tree = ttk.Treeview(results_frame, columns=columns, show='headings')
+        for column, heading, width in (
+            ('index', "#", 60),
+            ('score', "Score", 80),
+            ('risk', "Risk", 120),
+            ('contains', "Contains Personal Info", 400),
+        ):
+            self.batch_results_tree.heading(column, text=heading)
+            self.batch_results_tree.column(column, width=width, anchor=tk.W)
+        
+        scrollbar = ttk.Scrollbar(
+            results_frame,
+            orient=tk.VERTICAL,
+            command=self.batch_results_tree.yview
+        )
+        self.batch_results_tree.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.batch_results_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
     
     def create_wordlist_tab(self):
         """Create educational wordlist generator tab."""
@@ -298,11 +367,16 @@ class PasswordAnalyzerGUI:
             variable=self.authorize_var
         ).pack()
         
-        ttk.Button(
+        self.wordlist_button = ttk.Button(
             button_frame,
             text="Generate Educational Wordlist",
             command=self.generate_wordlist
-        ).pack(pady=10)
+        )
+        self.wordlist_button.pack(pady=10)
+        
+        # Progress (generation time isn't known up front)
+        self.wordlist_progress = ttk.Progressbar(self.wordlist_tab, mode='indeterminate')
+        self.wordlist_progress.pack(fill=tk.X, padx=10)
         
         # Status
         self.wordlist_status = ttk.Label(self.wordlist_tab, text="", font=("Arial", 9))
@@ -343,52 +417,59 @@ class PasswordAnalyzerGUI:
     
     def display_analysis_result(self, result):
         """Display analysis results in the text widget."""
-        self.results_text.config(state=tk.NORMAL)
-        self.results_text.delete(1.0, tk.END)
+        # Segments are collected as (text, tags) pairs and inserted with a
+        # single Text.insert, instead of one Tcl round-trip per line
+        parts = []
+        
+        def write(text, tag=""):
+            parts.append(text)
+            parts.append(tag)
         
         # Header
-        self.results_text.insert(tk.END, "="*80 + "\n", "header")
-        self.results_text.insert(tk.END, "PASSWORD ANALYSIS REPORT\n", "header")
-        self.results_text.insert(tk.END, "="*80 + "\n\n", "header")
+        write("="*80 + "\n", "header")
+        write("PASSWORD ANALYSIS REPORT\n", "header")
+        write("="*80 + "\n\n", "header")
         
         # Overall risk
         risk = result['overall_risk']
         risk_tag = "critical" if risk in ["CRITICAL", "VERY_HIGH"] else "warning" if risk in ["HIGH", "MEDIUM"] else "good"
-        self.results_text.insert(tk.END, f"Overall Risk Level: ", "info")
-        self.results_text.insert(tk.END, f"{risk}\n", risk_tag)
+        write(f"Overall Risk Level: ", "info")
+        write(f"{risk}\n", risk_tag)
         
         # Basic info
-        self.results_text.insert(tk.END, f"Password Length: {result['password_length']} characters\n")
-        self.results_text.insert(tk.END, f"zxcvbn Score: {result['zxcvbn_score']}/4\n\n")
+        write(f"Password Length: {result['password_length']} characters\n")
+        write(f"zxcvbn Score: {result['zxcvbn_score']}/4\n\n")
         
         # Critical warnings
         if result['has_contextual_risk']:
-            self.results_text.insert(tk.END, "🚨 CRITICAL WARNING:\n", "critical")
-            self.results_text.insert(
-                tk.END,
+            write("🚨 CRITICAL WARNING:\n", "critical")
+            write(
                 f"Password contains personal information: {', '.join(result['contextual_matches'])}\n\n",
                 "critical"
             )
         
         # Crack times
-        self.results_text.insert(tk.END, "Estimated Crack Times:\n", "info")
+        write("Estimated Crack Times:\n", "info")
         crack_times = result['crack_times_display']
-        self.results_text.insert(tk.END, f"  Online (throttled): {crack_times.get('online_throttling', 'N/A')}\n")
-        self.results_text.insert(tk.END, f"  Online (no throttle): {crack_times.get('online_no_throttling', 'N/A')}\n")
-        self.results_text.insert(tk.END, f"  Offline (slow): {crack_times.get('offline_slow_hashing_1e4_per_second', 'N/A')}\n")
-        self.results_text.insert(tk.END, f"  Offline (fast): {crack_times.get('offline_fast_hashing_1e10_per_second', 'N/A')}\n\n")
+        write(f"  Online (throttled): {crack_times.get('online_throttling', 'N/A')}\n")
+        write(f"  Online (no throttle): {crack_times.get('online_no_throttling', 'N/A')}\n")
+        write(f"  Offline (slow): {crack_times.get('offline_slow_hashing_1e4_per_second', 'N/A')}\n")
+        write(f"  Offline (fast): {crack_times.get('offline_fast_hashing_1e10_per_second', 'N/A')}\n\n")
         
         # Entropy
         if result['entropy']:
-            self.results_text.insert(tk.END, "Entropy Analysis:\n", "info")
-            self.results_text.insert(tk.END, f"  Entropy: {result['entropy']['entropy_bits']:.1f} bits\n")
-            self.results_text.insert(tk.END, f"  Strength: {result['entropy']['strength_rating']}\n\n")
+            write("Entropy Analysis:\n", "info")
+            write(f"  Entropy: {result['entropy']['entropy_bits']:.1f} bits\n")
+            write(f"  Strength: {result['entropy']['strength_rating']}\n\n")
         
         # Recommendations
-        self.results_text.insert(tk.END, "Recommendations:\n", "info")
+        write("Recommendations:\n", "info")
         for rec in result['recommendations']:
-            self.results_text.insert(tk.END, f"  {rec}\n")
+            write(f"  {rec}\n")
         
+        self.results_text.config(state=tk.NORMAL)
+        self.results_text.delete(1.0, tk.END)
+        self.results_text.insert(tk.END, *parts)
         self.results_text.config(state=tk.DISABLED)
     
     def browse_batch_file(self):
@@ -409,38 +490,146 @@ class PasswordAnalyzerGUI:
             messagebox.showwarning("Input Required", "Please select a password file.")
             return
         
+        # The file itself is read on the worker thread as analysis proceeds
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                passwords = [line.strip() for line in f if line.strip()]
-        except Exception as e:
+            file_size = os.path.getsize(filepath)
+        except OSError as e:
             messagebox.showerror("Error", f"Failed to read file: {e}")
             return
         
-        if not passwords:
-            messagebox.showwarning("Empty File", "No passwords found in file.")
-            return
-        
         # Get user inputs
         user_inputs_str = self.batch_user_inputs.get()
         user_inputs = [item.strip() for item in user_inputs_str.split(',') if item.strip()]
         
         # Log action
-        self.eula.log_action("GUI: Batch analysis", f"File: {filepath}, Count: {len(passwords)}")
-        
-        # Analyze
-        self.status_bar.config(text=f"Analyzing {len(passwords)} passwords...")
-        self.root.update()
-        
-        results = self.analyzer.batch_analyze(passwords, user_inputs=user_inputs)
-        
-        # Display summary
-        self.batch_results_text.config(state=tk.NORMAL)
-        self.batch_results_text.delete(1.0, tk.END)
+        self.eula.log_action("GUI: Batch analysis", f"File: {filepath}")
+        
+        # Analyze on a worker thread so the window stays responsive
+        self.status_bar.config(text=f"Analyzing passwords from {filepath}...")
+        
+        self.batch_results_tree.delete(*self.batch_results_tree.get_children())
+        self.batch_summary_label.config(text="")
+        
+        self._batch_results = []
+        self._batch_bytes_read = 0
+        self._batch_error = None
+        self._batch_cancel.clear()
+        # Progress is tracked in bytes, so the file needn't be counted first
+        self.batch_progress.config(maximum=max(file_size, 1), value=0)
+        self.batch_button.config(state=tk.DISABLED)
+        self.batch_cancel_button.config(state=tk.NORMAL)
+        
+        threading.Thread(
+            target=self._batch_worker,
+            args=(filepath, user_inputs),
+            daemon=True
+        ).start()
+        self.root.after(BATCH_POLL_MS, self._drain_queue)
+    
+    def cancel_batch(self):
+        """Stop the running batch analysis after the current password."""
+        self._batch_cancel.set()
+        self.batch_cancel_button.config(state=tk.DISABLED)
+        self.status_bar.config(text="Cancelling batch analysis...")
+    
+    def _iter_batch_file(self, filepath: str):
+        """Yield non-empty passwords from a file, counting bytes read for progress."""
+        with open(filepath, 'rb', buffering=BATCH_READ_BUFFER) as f:
+            for line in f:
+                self._batch_bytes_read += len(line)
+                password = line.decode('utf-8').strip()
+                if password:
+                    yield password
+    
+    def _batch_worker(self, filepath: str, user_inputs: List[str]):
+        """Analyze passwords off the Tk thread, posting each result to the queue."""
+        # Passwords read but not yet posted, in file order
+        pending = collections.deque()
+        # Distinct passwords sent for analysis, in order; their results arrive likewise
+        in_flight = collections.deque()
+        # Result per distinct password (None until analyzed)
+        results_by_password = {}
+        
+        def unique_passwords():
+            # Analyze each distinct password once; duplicates reuse its result
+            for password in self._iter_batch_file(filepath):
+                pending.append(password)
+                if password not in results_by_password:
+                    results_by_password[password] = None
+                    in_flight.append(password)
+                    yield password
+        
+        results = None
+        try:
+            # Large batches fan out to a process pool (one analyzer per worker),
+            # which reads the file only a bounded window ahead
+            results = self.analyzer.batch_analyze_iter(
+                unique_passwords(),
+                user_inputs=user_inputs,
+                mp_context=_POOL_CONTEXT
+            )
+            
+            posted = 0
+            for result in results:
+                if self._batch_cancel.is_set():
+                    break
+                results_by_password[in_flight.popleft()] = result
+                
+                # Post, in file order, everything up to the next unanalyzed password
+                while pending and results_by_password[pending[0]] is not None:
+                    self._result_queue.put((posted, results_by_password[pending.popleft()]))
+                    posted += 1
+            
+            if not self._batch_cancel.is_set():
+                # Duplicates read after the last distinct password have no
+                # later result to post them
+                while pending:
+                    self._result_queue.put((posted, results_by_password[pending.popleft()]))
+                    posted += 1
+        except (OSError, UnicodeDecodeError) as e:
+            self._batch_error = f"Failed to read file: {e}"
+        except Exception as e:
+            logger.error(f"Batch analysis failed: {e}")
+            self._batch_error = f"Batch analysis failed: {e}"
+        finally:
+            if results is not None:
+                # Cancels pool tasks that haven't started yet
+                results.close()
+            self._result_queue.put(_BATCH_DONE)
+    
+    def _drain_queue(self):
+        """Render queued batch results; reschedules itself until the worker is done."""
+        done = False
+        for _ in range(BATCH_DRAIN_LIMIT):
+            try:
+                item = self._result_queue.get_nowait()
+            except queue.Empty:
+                break
+            
+            if item is _BATCH_DONE:
+                done = True
+                break
+            
+            i, result = item
+            self._batch_results.append(result)
+            self.batch_results_tree.insert('', tk.END, values=(
+                i + 1,
+                f"{result['zxcvbn_score']}/4",
+                result['overall_risk'],
+                ', '.join(result['contextual_matches'])
+            ))
+        
+        if done:
+            self._finish_batch()
+            return
         
-        self.batch_results_text.insert(tk.END, "="*80 + "\n")
-        self.batch_results_text.insert(tk.END, "BATCH ANALYSIS SUMMARY\n")
-        self.batch_results_text.insert(tk.END, "="*80 + "\n\n")
-        self.batch_results_text.insert(tk.END, f"Total passwords analyzed: {len(results)}\n\n")
+        self.batch_progress.config(value=self._batch_bytes_read)
+        self.status_bar.config(text=f"Analyzed {len(self._batch_results)} passwords...")
+        self.root.after(BATCH_POLL_MS, self._drain_queue)
+    
+    def _finish_batch(self):
+        """Show the summary once every result is in and re-enable the controls."""
+        results = self._batch_results
         
         # Risk distribution
         risk_counts = {}
@@ -448,25 +637,30 @@ class PasswordAnalyzerGUI:
             risk = result['overall_risk']
             risk_counts[risk] = risk_counts.get(risk, 0) + 1
         
-        self.batch_results_text.insert(tk.END, "Risk Distribution:\n")
+        summary = [
+            f"Total passwords analyzed: {len(results)}",
+            "Risk Distribution:",
+        ]
         for risk, count in sorted(risk_counts.items()):
             percentage = count / len(results) * 100
-            self.batch_results_text.insert(tk.END, f"  {risk}: {count} ({percentage:.1f}%)\n")
-        
-        self.batch_results_text.insert(tk.END, "\n" + "="*80 + "\n")
-        self.batch_results_text.insert(tk.END, "INDIVIDUAL RESULTS\n")
-        self.batch_results_text.insert(tk.END, "="*80 + "\n\n")
-        
-        for i, result in enumerate(results, 1):
-            self.batch_results_text.insert(tk.END, f"Password #{i}:\n")
-            self.batch_results_text.insert(tk.END, f"  Score: {result['zxcvbn_score']}/4\n")
-            self.batch_results_text.insert(tk.END, f"  Risk: {result['overall_risk']}\n")
-            if result['has_contextual_risk']:
-                self.batch_results_text.insert(tk.END, f"  ⚠️  Contains: {result['contextual_matches']}\n")
-            self.batch_results_text.insert(tk.END, "\n")
-        
-        self.batch_results_text.config(state=tk.DISABLED)
-        self.status_bar.config(text="Batch analysis complete")
+            summary.append(f"  {risk}: {count} ({percentage:.1f}%)")
+        
+        self.batch_summary_label.config(text="\n".join(summary))
+        
+        self.batch_progress.config(value=self._batch_bytes_read)
+        self.batch_button.config(state=tk.NORMAL)
+        self.batch_cancel_button.config(state=tk.DISABLED)
+        
+        if self._batch_error:
+            self.status_bar.config(text="Batch analysis failed")
+            messagebox.showerror("Error", self._batch_error)
+        elif not results and not self._batch_cancel.is_set():
+            self.status_bar.config(text="Ready")
+            messagebox.showwarning("Empty File", "No passwords found in file.")
+        elif self._batch_cancel.is_set():
+            self.status_bar.config(text=f"Batch analysis cancelled after {len(results)} passwords")
+        else:
+            self.status_bar.config(text="Batch analysis complete")
     
     def browse_wordlist_output(self):
         """Browse for wordlist output location."""
@@ -510,11 +704,38 @@ class PasswordAnalyzerGUI:
         # Log action
         self.eula.log_action("GUI: Wordlist export", f"Items: {len(user_inputs)}")
         
-        # Generate
+        # Generate on a worker thread so the window stays responsive
         self.status_bar.config(text="Generating wordlist...")
-        self.root.update()
+        self.wordlist_button.config(state=tk.DISABLED)
+        self.wordlist_progress.start()
+        
+        threading.Thread(
+            target=self._wordlist_worker,
+            args=(user_inputs, output_path),
+            daemon=True
+        ).start()
+        self.root.after(BATCH_POLL_MS, self._poll_wordlist, output_path)
+    
+    def _wordlist_worker(self, user_inputs: List[str], output_path: str):
+        """Generate the wordlist off the Tk thread and post the result."""
+        self._wordlist_queue.put(
+            self.generator.generate_educational_wordlist(user_inputs, output_path)
+        )
+    
+    def _poll_wordlist(self, output_path: str):
+        """Wait for the wordlist worker without blocking the Tk loop."""
+        try:
+            result = self._wordlist_queue.get_nowait()
+        except queue.Empty:
+            self.root.after(BATCH_POLL_MS, self._poll_wordlist, output_path)
+            return
         
-        result = self.generator.generate_educational_wordlist(user_inputs, output_path)
+        self._on_wordlist_done(result, output_path)
+    
+    def _on_wordlist_done(self, result, output_path: str):
+        """Report a finished wordlist generation on the Tk thread."""
+        self.wordlist_progress.stop()
+        self.wordlist_button.config(state=tk.NORMAL)
         
         if result['success']:
             self.wordlist_status.config(
@@ -2,8 +2,234 @@
 Pattern detection for common password weaknesses.
 """
 
+import bisect
+import functools
+import itertools
 import re
-from typing import Dict, List
+import types
+from typing import Dict, Iterable, List
+
+try:
+    import numpy as np
+except ImportError:  # Optional: the regex/loop implementations are used instead
+    np = None
+
+try:
+    from numba import njit
+except ImportError:  # Optional: the NumPy/regex implementations are used instead
+    njit = None
+
+try:
+    import ahocorasick
+except ImportError:  # Optional: fall back to per-pattern substring checks
+    ahocorasick = None
+
+# Regexes are compiled once at import rather than on every call
+_REPEATED_RE = re.compile(r'(.)\1{2,}')  # 3 or more repeated characters
+
+# Common date formats, fused into one scan; longer forms are tried first
+# Must stay free of capturing groups: findall then returns whole matches
+# directly, without allocating group tuples or match objects
+_DATE_RE = re.compile(
+    r'\d{1,2}[-/]\d{1,2}[-/]\d{2,4}'   # DD/MM/YYYY or MM/DD/YYYY
+    r'|\d{4}[-/]\d{1,2}[-/]\d{1,2}'    # YYYY/MM/DD
+    r'|\d{8}'                           # YYYYMMDD or DDMMYYYY
+    r'|\d{6}'                           # YYMMDD or DDMMYY
+    r'|(?:19|20)\d{2}'                  # Years 1900-2099
+)
+
+# Common keyboard patterns; immutable, and read as module globals by the
+# detectors rather than through instance attribute lookups
+_KEYBOARD_PATTERNS = (
+    'qwerty', 'asdf', 'zxcv', 'qwertyuiop', 'asdfghjkl', 'zxcvbnm',
+    '1234567890', 'qazwsx', 'zaq1', '!qaz', '@wsx', '#edc'
+)
+
+# Leet speak mappings; read-only, since every detector shares it
+_LEET_MAPPINGS = types.MappingProxyType({
+    'a': ('4', '@'),
+    'e': ('3',),
+    'i': ('1', '!'),
+    'o': ('0',),
+    's': ('5', '$'),
+    't': ('7', '+'),
+    'l': ('1',),
+    'g': ('9',),
+    'b': ('8',)
+})
+
+# Every substitution character; '1' stands in for both 'i' and 'l'
+_LEET_CHARS = frozenset(sub for subs in _LEET_MAPPINGS.values() for sub in subs)
+
+# Substitution characters and their report labels, in report order
+_COMMON_SUBSTITUTIONS = tuple(
+    (sub_char, f"{sub_char}→{original}")
+    for sub_char, original in (
+        ('@', 'a'),
+        ('3', 'e'),
+        ('1', 'i'),
+        ('!', 'i'),
+        ('0', 'o'),
+        ('5', 's'),
+        ('$', 's'),
+        ('7', 't'),
+        ('+', 't')
+    )
+)
+
+# Character codes of the above, for indexing the compiled scan's presence mask
+_LEET_CODES = tuple(ord(sub_char) for sub_char in _LEET_CHARS)
+_COMMON_SUBSTITUTION_CODES = tuple(
+    (ord(sub_char), label) for sub_char, label in _COMMON_SUBSTITUTIONS
+)
+
+# Joins passwords for batch scans; no pattern can match across it
+_BATCH_SEPARATOR = '\x00'
+
+# Maximum number of memoized pattern reports kept per detector
+PATTERN_CACHE_SIZE = 8192
+
+# Shortest password any multi-character pattern (repeat, sequence, date,
+# keyboard run) can match
+MIN_PATTERN_LENGTH = 3
+
+# Shorter passwords aren't worth the array round-trip of the compiled scan
+JIT_MIN_LENGTH = 8
+
+# With the Aho-Corasick automata the regular detectors stay ahead of the
+# compiled scan for anything but very long inputs
+AUTOMATON_JIT_MIN_LENGTH = 128
+
+# Same trade-off for the vectorized NumPy sequential check
+VECTORIZE_MIN_LENGTH = 8
+
+
+if njit is not None and np is not None:
+    @njit(cache=True)
+    def _digit_run(buf, start, count):
+        """True if buf[start:start+count] is all ASCII digits."""
+        if start + count > buf.shape[0]:
+            return False
+        for i in range(start, start + count):
+            if buf[i] < 48 or buf[i] > 57:
+                return False
+        return True
+    
+    @njit(cache=True)
+    def _is_date_sep(buf, i):
+        """True if buf[i] is '-' or '/'."""
+        return i < buf.shape[0] and (buf[i] == 45 or buf[i] == 47)
+    
+    @njit(cache=True)
+    def _match_date_at(buf, p):
+        """
+        End of the _DATE_RE match starting at p, or -1.
+        
+        Alternatives and quantifiers are tried in the same order as the regex
+        engine (left to right, greedy first), so the chosen match is identical.
+        """
+        # \d{1,2}[-/]\d{1,2}[-/]\d{2,4}
+        for a in (2, 1):
+            if _digit_run(buf, p, a) and _is_date_sep(buf, p + a):
+                q = p + a + 1
+                for b in (2, 1):
+                    if _digit_run(buf, q, b) and _is_date_sep(buf, q + b):
+                        r = q + b + 1
+                        for c in (4, 3, 2):
+                            if _digit_run(buf, r, c):
+                                return r + c
+        # \d{4}[-/]\d{1,2}[-/]\d{1,2}
+        if _digit_run(buf, p, 4) and _is_date_sep(buf, p + 4):
+            q = p + 5
+            for b in (2, 1):
+                if _digit_run(buf, q, b) and _is_date_sep(buf, q + b):
+                    r = q + b + 1
+                    for c in (2, 1):
+                        if _digit_run(buf, r, c):
+                            return r + c
+        # \d{8} and \d{6}
+        if _digit_run(buf, p, 8):
+            return p + 8
+        if _digit_run(buf, p, 6):
+            return p + 6
+        # (?:19|20)\d{2}
+        if p + 1 < buf.shape[0] and (
+            (buf[p] == 49 and buf[p + 1] == 57) or (buf[p] == 50 and buf[p + 1] == 48)
+        ) and _digit_run(buf, p + 2, 2):
+            return p + 4
+        return -1
+    
+    @njit(cache=True)
+    def _scan_password_features(buf):
+        """
+        Single pass over an ASCII byte array.
+        
+        Returns (runs, numeric_seq, alpha_seq, present, dates): [start, end) spans
+        of 3+ repeated characters, per-window flags for ascending/descending digit
+        and letter triples, a 128-entry mask of characters present, and
+        [start, end) spans of non-overlapping _DATE_RE matches.
+        """
+        n = buf.shape[0]
+        present = np.zeros(128, np.bool_)
+        runs = np.empty((n, 2), np.int64)
+        run_count = 0
+        run_start = 0
+        
+        for i in range(n):
+            present[buf[i]] = True
+            if i > 0 and buf[i] != buf[i - 1]:
+                # '.' in the regex path doesn't match newlines
+                if i - run_start >= 3 and buf[run_start] != 10:
+                    runs[run_count, 0] = run_start
+                    runs[run_count, 1] = i
+                    run_count += 1
+                run_start = i
+        if n - run_start >= 3 and buf[run_start] != 10:
+            runs[run_count, 0] = run_start
+            runs[run_count, 1] = n
+            run_count += 1
+        
+        windows = max(n - 2, 0)
+        numeric_seq = np.zeros(windows, np.bool_)
+        alpha_seq = np.zeros(windows, np.bool_)
+        for i in range(windows):
+            a = np.int64(buf[i])
+            b = np.int64(buf[i + 1])
+            c = np.int64(buf[i + 2])
+            step1 = b - a
+            step2 = c - b
+            monotonic = (step1 == 1 and step2 == 1) or (step1 == -1 and step2 == -1)
+            if 48 <= a <= 57 and 48 <= b <= 57 and 48 <= c <= 57:
+                numeric_seq[i] = monotonic
+            else:
+                # Lowercase A-Z so case doesn't break alphabetic runs
+                if 65 <= a <= 90:
+                    a += 32
+                if 65 <= b <= 90:
+                    b += 32
+                if 65 <= c <= 90:
+                    c += 32
+                if 97 <= a <= 122 and 97 <= b <= 122 and 97 <= c <= 122:
+                    step1 = b - a
+                    step2 = c - b
+                    alpha_seq[i] = (step1 == 1 and step2 == 1) or (step1 == -1 and step2 == -1)
+        
+        dates = np.empty((n, 2), np.int64)
+        date_count = 0
+        p = 0
+        while p < n:
+            end = _match_date_at(buf, p)
+            if end == -1:
+                p += 1
+            else:
+                dates[date_count, 0] = p
+                dates[date_count, 1] = end
+                date_count += 1
+                p = end
+        
+        return runs[:run_count], numeric_seq, alpha_seq, present, dates[:date_count]
+else:
+    _scan_password_features = None
 
 
 class PatternDetector:
@@ -12,23 +238,16 @@ class PatternDetector:
     """
     
     # Common keyboard patterns
-    KEYBOARD_PATTERNS = [
-        'qwerty', 'asdf', 'zxcv', 'qwertyuiop', 'asdfghjkl', 'zxcvbnm',
-        '1234567890', 'qazwsx', 'zaq1', '!qaz', '@wsx', '#edc'
-    ]
+    KEYBOARD_PATTERNS = _KEYBOARD_PATTERNS
     
     # Leet speak mappings
-    LEET_MAPPINGS = {
-        'a': ['4', '@'],
-        'e': ['3'],
-        'i': ['1', '!'],
-        'o': ['0'],
-        's': ['5', '$'],
-        't': ['7', '+'],
-        'l': ['1'],
-        'g': ['9'],
-        'b': ['8']
-    }
+    LEET_MAPPINGS = _LEET_MAPPINGS
+    
+    def __init__(self):
+        # Detection is deterministic, so repeated passwords are served from cache
+        self._detect_cached = functools.lru_cache(maxsize=PATTERN_CACHE_SIZE)(
+            self._detect_patterns_uncached
+        )
     
     def detect_patterns(self, password: str) -> Dict[str, List[str]]:
         """
@@ -40,6 +259,95 @@ class PatternDetector:
         Returns:
             Dictionary of detected patterns
         """
+        patterns = self._detect_cached(password)
+        
+        # Fresh lists so callers can't mutate the cached report
+        return {
+            key: list(value) if isinstance(value, list) else value
+            for key, value in patterns.items()
+        }
+    
+    def detect_patterns_many(self, passwords: Iterable[str]) -> List[Dict[str, List[str]]]:
+        """
+        Detect patterns in many passwords at once.
+        
+        Passwords the compiled kernel handles are scanned individually as
+        usual; for the rest, the repeat, date and keyboard scans run once
+        over all of them joined by a separator instead of once each.
+        Results match detect_patterns; the per-password cache is bypassed.
+        
+        Args:
+            passwords: Passwords to analyze
+            
+        Returns:
+            Dictionary of detected patterns for each password, in input order
+        """
+        passwords = list(passwords)
+        results = [None] * len(passwords)
+        
+        batch = []
+        for i, password in enumerate(passwords):
+            if (
+                len(password) < MIN_PATTERN_LENGTH
+                or self._use_compiled_scan(password)
+                or _BATCH_SEPARATOR in password
+            ):
+                # Short inputs exit early, and a separator inside a password
+                # (or between two empty ones) could let a match straddle entries
+                results[i] = self._detect_patterns_uncached(password)
+            else:
+                batch.append(i)
+        
+        if batch:
+            batch_passwords = [passwords[i] for i in batch]
+            joined = _BATCH_SEPARATOR.join(batch_passwords)
+            starts = self._batch_offsets(batch_passwords)
+            
+            repeated = self._bucket_matches(_REPEATED_RE, joined, starts)
+            dates = self._bucket_matches(_DATE_RE, joined, starts)
+            keyboard = self._find_keyboard_patterns_many(batch_passwords, joined)
+            sequential = self._find_sequential_many(batch_passwords)
+            
+            for j, i in enumerate(batch):
+                password = passwords[i]
+                results[i] = {
+                    'repeated_sequences': repeated[j],
+                    'keyboard_patterns': keyboard[j],
+                    'dates': dates[j],
+                    'sequential': sequential[j],
+                    'leet_speak': self._detect_leet_speak(password),
+                    'common_substitutions': self._find_common_substitutions(password)
+                }
+        
+        return results
+    
+    def clear_cache(self):
+        """Discard all memoized pattern reports."""
+        self._detect_cached.cache_clear()
+    
+    # lru_cache-style name, matching PasswordAnalyzer.cache_clear
+    cache_clear = clear_cache
+    
+    def cache_info(self):
+        """Hit/miss statistics for the pattern report cache."""
+        return self._detect_cached.cache_info()
+    
+    def _detect_patterns_uncached(self, password: str) -> Dict[str, List[str]]:
+        """Run every pattern detector over one password."""
+        if len(password) < MIN_PATTERN_LENGTH:
+            # Only the per-character checks can fire on such short input
+            return {
+                'repeated_sequences': [],
+                'keyboard_patterns': [],
+                'dates': [],
+                'sequential': [],
+                'leet_speak': self._detect_leet_speak(password),
+                'common_substitutions': self._find_common_substitutions(password)
+            }
+        
+        if self._use_compiled_scan(password):
+            return self._detect_patterns_compiled(password)
+        
         return {
             'repeated_sequences': self._find_repeated_sequences(password),
             'keyboard_patterns': self._find_keyboard_patterns(password),
@@ -49,51 +357,98 @@ class PatternDetector:
             'common_substitutions': self._find_common_substitutions(password)
         }
     
-    def _find_repeated_sequences(self, password: str) -> List[str]:
-        """Find repeated character sequences (e.g., 'aaa', '111')."""
-        sequences = []
-        pattern = r'(.)\1{2,}'  # 3 or more repeated characters
+    @staticmethod
+    def _use_compiled_scan(password: str) -> bool:
+        """Whether the compiled kernel is available and worth it for password."""
+        min_length = JIT_MIN_LENGTH if _SEQUENTIAL_AUTOMATON is None else AUTOMATON_JIT_MIN_LENGTH
+        return (
+            _scan_password_features is not None
+            and len(password) >= min_length
+            and password.isascii()
+        )
+    
+    def _detect_patterns_compiled(self, password: str) -> Dict[str, List[str]]:
+        """Fused repeated/date/sequential/leet scan using the compiled kernel."""
+        buf = np.frombuffer(password.encode('ascii'), dtype=np.uint8)
+        runs, numeric_seq, alpha_seq, present, dates = _scan_password_features(buf)
         
-        for match in re.finditer(pattern, password):
-            sequences.append(match.group())
+        sequential = [password[i:i+3] for i in np.flatnonzero(numeric_seq)]
+        sequential.extend(password[i:i+3].lower() for i in np.flatnonzero(alpha_seq))
         
-        return sequences
+        leet_count = sum(1 for code in _LEET_CODES if present[code])
+        
+        return {
+            'repeated_sequences': [password[start:end] for start, end in runs],
+            'keyboard_patterns': self._find_keyboard_patterns(password),
+            'dates': [password[start:end] for start, end in dates],
+            'sequential': sequential,
+            'leet_speak': leet_count >= 2,
+            # The kernel's presence mask already answers every lookup
+            'common_substitutions': [
+                label for code, label in _COMMON_SUBSTITUTION_CODES if present[code]
+            ]
+        }
+    
+    def _find_repeated_sequences(self, password: str) -> List[str]:
+        """Find repeated character sequences (e.g., 'aaa', '111')."""
+        return [match.group() for match in _REPEATED_RE.finditer(password)]
     
     def _find_keyboard_patterns(self, password: str) -> List[str]:
         """Detect common keyboard patterns."""
-        found = []
         password_lower = password.lower()
         
-        for pattern in self.KEYBOARD_PATTERNS:
-            if pattern in password_lower:
-                found.append(pattern)
-            # Check reverse too
-            if pattern[::-1] in password_lower:
-                found.append(pattern[::-1])
+        if _KEYBOARD_AUTOMATON is not None:
+            # One pass finds every pattern and reversed pattern
+            matched = {needle for _, needle in _KEYBOARD_AUTOMATON.iter(password_lower)}
+            return [needle for needle in _KEYBOARD_NEEDLES if needle in matched]
         
-        return found
+        # Reverses are precomputed in _KEYBOARD_NEEDLES
+        return [needle for needle in _KEYBOARD_NEEDLES if needle in password_lower]
     
-    def _find_dates(self, password: str) -> List[str]:
-        """Detect date patterns."""
-        dates = []
+    def _find_keyboard_patterns_many(self, passwords: List[str], joined: str) -> List[List[str]]:
+        """Keyboard patterns for each of the joined passwords, in one scan."""
+        if _KEYBOARD_AUTOMATON is None:
+            return [self._find_keyboard_patterns(password) for password in passwords]
         
-        # Common date formats
-        date_patterns = [
-            r'\d{1,2}[-/]\d{1,2}[-/]\d{2,4}',  # DD/MM/YYYY or MM/DD/YYYY
-            r'\d{4}[-/]\d{1,2}[-/]\d{1,2}',    # YYYY/MM/DD
-            r'\d{8}',                           # YYYYMMDD or DDMMYYYY
-            r'\d{6}',                           # YYMMDD or DDMMYY
-            r'(19|20)\d{2}',                    # Years 1900-2099
-        ]
+        joined_lower = joined.lower()
+        starts = self._batch_offsets(passwords)
+        if len(joined_lower) != len(joined):
+            # Some characters grow when lowercased, shifting every later offset
+            lowered = [password.lower() for password in passwords]
+            joined_lower = _BATCH_SEPARATOR.join(lowered)
+            starts = self._batch_offsets(lowered)
         
-        for pattern in date_patterns:
-            matches = re.findall(pattern, password)
-            dates.extend(matches)
+        matched = [set() for _ in passwords]
+        for end, needle in _KEYBOARD_AUTOMATON.iter(joined_lower):
+            matched[bisect.bisect_right(starts, end) - 1].add(needle)
         
-        return dates
+        return [[needle for needle in _KEYBOARD_NEEDLES if needle in found] for found in matched]
+    
+    @staticmethod
+    def _batch_offsets(passwords: List[str]) -> List[int]:
+        """Start offset of each password in the separator-joined string."""
+        return list(itertools.accumulate((len(p) + 1 for p in passwords[:-1]), initial=0))
+    
+    @staticmethod
+    def _bucket_matches(regex, joined: str, starts: List[int]) -> List[List[str]]:
+        """Assign each match in the joined string to the password it falls in."""
+        buckets = [[] for _ in starts]
+        for match in regex.finditer(joined):
+            buckets[bisect.bisect_right(starts, match.start()) - 1].append(match.group())
+        return buckets
+    
+    def _find_dates(self, password: str) -> List[str]:
+        """Detect date patterns."""
+        return _DATE_RE.findall(password)
     
     def _find_sequential(self, password: str) -> List[str]:
         """Find sequential patterns (e.g., '123', 'abc')."""
+        if _SEQUENTIAL_AUTOMATON is not None and password.isascii():
+            return self._find_sequential_automaton(password)
+        
+        if np is not None and len(password) >= VECTORIZE_MIN_LENGTH and password.isascii():
+            return self._find_sequential_vectorized(password)
+        
         sequences = []
         
         # Check for numeric sequences
@@ -118,36 +473,122 @@ class PatternDetector:
         
         return sequences
     
-    def _detect_leet_speak(self, password: str) -> bool:
-        """Detect if password uses leet speak substitutions."""
-        leet_count = 0
+    def _find_sequential_automaton(self, password: str) -> List[str]:
+        """Aho-Corasick _find_sequential for ASCII passwords."""
+        numeric = []
+        alphabetic = []
+        # Every needle is three characters, so hits arrive in window order
+        for _, (is_alpha, needle) in _SEQUENTIAL_AUTOMATON.iter(password.lower()):
+            (alphabetic if is_alpha else numeric).append(needle)
         
-        for char, substitutions in self.LEET_MAPPINGS.items():
-            for sub in substitutions:
-                if sub in password:
-                    leet_count += 1
+        numeric.extend(alphabetic)
+        return numeric
+    
+    def _find_sequential_vectorized(self, password: str) -> List[str]:
+        """Vectorized _find_sequential for ASCII passwords."""
+        lowered = password.lower()
+        digit_hits, alpha_hits = self._sequential_hits(lowered)
         
-        # If multiple leet substitutions found, likely using leet speak
-        return leet_count >= 2
+        sequences = [password[i:i+3] for i in digit_hits]
+        sequences.extend(lowered[i:i+3] for i in alpha_hits)
+        return sequences
     
-    def _find_common_substitutions(self, password: str) -> List[str]:
-        """Find common character substitutions."""
-        substitutions = []
-        
-        common_subs = {
-            '@': 'a',
-            '3': 'e',
-            '1': 'i',
-            '!': 'i',
-            '0': 'o',
-            '5': 's',
-            '$': 's',
-            '7': 't',
-            '+': 't'
-        }
+    def _find_sequential_many(self, passwords: List[str]) -> List[List[str]]:
+        """Sequential patterns for many passwords, ASCII ones in one vectorized pass."""
+        if _SEQUENTIAL_AUTOMATON is not None:
+            # Already linear per password, with nothing left to amortize
+            return [self._find_sequential(password) for password in passwords]
+        
+        results = [None] * len(passwords)
         
-        for sub_char, original in common_subs.items():
-            if sub_char in password:
-                substitutions.append(f"{sub_char}→{original}")
+        group = []
+        for i, password in enumerate(passwords):
+            if np is not None and password.isascii():
+                group.append(i)
+            else:
+                results[i] = self._find_sequential(password)
+        
+        if group:
+            group_passwords = [passwords[i] for i in group]
+            # The separator is neither digit nor letter, so no window spans two passwords
+            lowered = _BATCH_SEPARATOR.join(group_passwords).lower()
+            starts = np.array(self._batch_offsets(group_passwords))
+            digit_hits, alpha_hits = self._sequential_hits(lowered)
+            
+            buckets = [[] for _ in group]
+            for hits in (digit_hits, alpha_hits):
+                owners = np.searchsorted(starts, hits, side='right') - 1
+                for i, owner in zip(hits.tolist(), owners.tolist()):
+                    # Digits are unchanged by lower(), so one slice serves both kinds
+                    buckets[owner].append(lowered[i:i+3])
+            
+            for j, i in enumerate(group):
+                results[i] = buckets[j]
+        
+        return results
+    
+    @staticmethod
+    def _sequential_hits(lowered: str):
+        """Start indices of numeric and alphabetic runs of three in lowercase ASCII."""
+        codes = np.frombuffer(lowered.encode('ascii'), dtype=np.uint8).astype(np.int16)
         
-        return substitutions
+        # Windows of three whose two steps are both +1 or both -1
+        steps = np.diff(codes)
+        monotonic = (steps[:-1] == steps[1:]) & (np.abs(steps[:-1]) == 1)
+        
+        is_digit = (codes >= 48) & (codes <= 57)
+        is_alpha = (codes >= 97) & (codes <= 122)
+        digit_windows = is_digit[:-2] & is_digit[1:-1] & is_digit[2:]
+        alpha_windows = is_alpha[:-2] & is_alpha[1:-1] & is_alpha[2:]
+        
+        return np.flatnonzero(monotonic & digit_windows), np.flatnonzero(monotonic & alpha_windows)
+    
+    def _detect_leet_speak(self, password: str) -> bool:
+        """Detect if password uses leet speak substitutions."""
+        # If multiple distinct leet characters are found, likely using leet speak
+        return len(_LEET_CHARS.intersection(password)) >= 2
+    
+    def _find_common_substitutions(self, password: str) -> List[str]:
+        """Find common character substitutions."""
+        return [label for sub_char, label in _COMMON_SUBSTITUTIONS if sub_char in password]
+
+
+def _build_keyboard_automaton(needles):
+    """Build an Aho-Corasick automaton over the keyboard patterns."""
+    automaton = ahocorasick.Automaton()
+    for needle in needles:
+        automaton.add_word(needle, needle)
+    automaton.make_automaton()
+    return automaton
+
+
+def _build_sequential_automaton():
+    """
+    Build an Aho-Corasick automaton over every ascending and descending
+    run of three digits or lowercase letters.
+    
+    Values are (is_alpha, needle), so one pass separates the numeric and
+    alphabetic sequences _find_sequential reports.
+    """
+    automaton = ahocorasick.Automaton()
+    for is_alpha, alphabet in ((False, '0123456789'), (True, 'abcdefghijklmnopqrstuvwxyz')):
+        for run in (alphabet, alphabet[::-1]):
+            for i in range(len(run) - 2):
+                automaton.add_word(run[i:i+3], (is_alpha, run[i:i+3]))
+    automaton.make_automaton()
+    return automaton
+
+
+# Every keyboard pattern followed by its reverse, in reporting order; built
+# once so the per-password checks don't re-slice each pattern
+_KEYBOARD_NEEDLES = tuple(
+    needle
+    for pattern in _KEYBOARD_PATTERNS
+    for needle in (pattern, pattern[::-1])
+)
+
+_KEYBOARD_AUTOMATON = (
+    _build_keyboard_automaton(_KEYBOARD_NEEDLES) if ahocorasick is not None else None
+)
+
+_SEQUENTIAL_AUTOMATON = _build_sequential_automaton() if ahocorasick is not None else None
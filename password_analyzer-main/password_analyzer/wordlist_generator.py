@@ -2,13 +2,111 @@
 Educational wordlist generator with safety controls.
 """
 
+import itertools
 import logging
-from typing import List, Set, Dict
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import AbstractSet, List, Set, Dict, Optional, TextIO, Tuple
 from datetime import datetime
 import random
+import re
+import types
 
 logger = logging.getLogger(__name__)
 
+# Section separator rule, built once instead of at every use
+_SEP80 = "=" * 80
+_SEP80_LINE = _SEP80 + "\n"
+
+# Warning header; everything but the timestamp is rendered once at import
+_HEADER_TEMPLATE = f"""
+{_SEP80}
+⚠️  EDUCATIONAL WORDLIST - FOR AUTHORIZED USE ONLY ⚠️
+{_SEP80}
+
+LEGAL NOTICE:
+This file is generated for PASSWORD AWARENESS and AUTHORIZED SECURITY TESTING only.
+
+PERMITTED USES:
+✓ Testing YOUR OWN passwords for weaknesses
+✓ Educational purposes to understand password vulnerabilities
+✓ Authorized penetration testing with written permission
+✓ Security awareness training
+
+PROHIBITED USES:
+✗ Unauthorized access attempts
+✗ Password cracking without authorization
+✗ Distribution for malicious purposes
+✗ Any illegal activity
+
+BY USING THIS FILE, YOU ACKNOWLEDGE:
+- You will use this ONLY for authorized purposes
+- You understand unauthorized access is illegal
+- You accept full responsibility for your actions
+
+Generated: {{ts}}
+Tool: Password Strength Analyzer v1.0.0
+"""
+
+# Secure password suggestions; static, so the file text is joined once at import
+_SUGGESTIONS = (
+    "",
+    "INSTEAD OF weak passwords, USE THESE STRATEGIES:",
+    "",
+    "1. PASSPHRASES (Recommended):",
+    "   - Combine 4-6 random, unrelated words",
+    "   - Example: correct-horse-battery-staple",
+    "   - Easy to remember, hard to crack",
+    "",
+    "2. PASSWORD MANAGER GENERATED:",
+    "   - Use a password manager (e.g., Bitwarden, 1Password, KeePass)",
+    "   - Generate unique 16+ character passwords for each account",
+    "   - Example: Kp9$mN2#vL8@wQ5&",
+    "",
+    "3. DICE WARE METHOD:",
+    "   - Use physical dice to randomly select words from a wordlist",
+    "   - Ensures true randomness",
+    "   - Combine 5-7 words for strong security",
+    "",
+    "4. AVOID THESE PATTERNS:",
+    "   ✗ Personal information (names, birthdays, addresses)",
+    "   ✗ Dictionary words with simple substitutions",
+    "   ✗ Common sequences (123, abc, qwerty)",
+    "   ✗ Keyboard patterns",
+    "   ✗ Repeating the same password across sites",
+    "",
+    "5. ENABLE TWO-FACTOR AUTHENTICATION (2FA):",
+    "   - Even strong passwords benefit from 2FA",
+    "   - Use authenticator apps (not SMS when possible)",
+    "",
+    "REMEMBER: Length + Randomness = Security",
+    "Aim for: 12+ characters (passphrases) or 16+ (random passwords)",
+    ""
+)
+_SUGGESTIONS_TEXT = "".join(f"{suggestion}\n" for suggestion in _SUGGESTIONS)
+
+# Outputs up to this size (bytes) skip Python's file objects entirely
+DIRECT_WRITE_LIMIT = 1 << 20
+
+
+def _write_bytes(path: str, payload: bytes):
+    """Write payload to path; small outputs go out in one raw write."""
+    if len(payload) > DIRECT_WRITE_LIMIT:
+        with open(path, 'wb') as f:
+            f.write(payload)
+        return
+    
+    # O_BINARY stops Windows from translating newlines on the raw descriptor
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+    fd = os.open(path, flags, 0o666)
+    try:
+        # os.write may be partial, so loop until everything is out
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
 
 class WordlistGenerator:
     """
@@ -16,21 +114,32 @@ class WordlistGenerator:
     Includes prominent safety warnings and limits output size.
     """
     
+    # All state is class-level, so instances need no __dict__
+    __slots__ = ()
+    
     MAX_ENTRIES = 200  # Hard limit on wordlist size
     
-    def __init__(self):
-        self.common_years = [str(year) for year in range(1950, 2026)]
-        self.common_suffixes = ['123', '!', '1', '12', '2024', '2025']
-        
-        # Limited leet speak mappings for educational purposes
-        self.leet_map = {
-            'a': '4', 'e': '3', 'i': '1', 'o': '0', 's': '5', 't': '7'
-        }
+    # Invariant tables, built once at import and shared by every instance
+    COMMON_YEARS = tuple(str(year) for year in range(1950, 2026))
+    COMMON_SUFFIXES = ('123', '!', '1', '12', '2024', '2025')
+    
+    # Limited leet speak mappings for educational purposes
+    LEET_MAP = types.MappingProxyType({
+        'a': '4', 'e': '3', 'i': '1', 'o': '0', 's': '5', 't': '7'
+    })
+    _LEET_TRANS = str.maketrans(dict(LEET_MAP))
+    _LEET_RE = re.compile(f"[{''.join(LEET_MAP)}]")
+    
+    # Former per-instance names
+    common_years = COMMON_YEARS
+    common_suffixes = COMMON_SUFFIXES
+    leet_map = LEET_MAP
     
     def generate_educational_wordlist(
         self,
         user_inputs: List[str],
-        output_path: str = "educational_wordlist.txt"
+        output_path: str = "educational_wordlist.txt",
+        output: Optional[TextIO] = None
     ) -> Dict[str, any]:
         """
         Generate a small educational wordlist showing password weaknesses.
@@ -38,65 +147,90 @@ class WordlistGenerator:
         Args:
             user_inputs: User-provided contextual items
             output_path: Where to save the wordlist
+            output: Text stream to write to instead of output_path (e.g. io.StringIO)
             
         Returns:
             Dictionary with generation statistics
         """
-        entries = set()
+        return self._generate_wordlist(
+            user_inputs, output_path, self._generate_header(), output=output
+        )
+    
+    def generate_batch(
+        self,
+        jobs: List[Tuple[List[str], str]],
+        workers: Optional[int] = None
+    ) -> List[Dict[str, any]]:
+        """
+        Generate several educational wordlists, e.g. one per trainee.
         
-        # Add header warning
+        The header is rendered once for the whole batch, and files are
+        written concurrently since the work is mostly file I/O.
+        
+        Args:
+            jobs: (user_inputs, output_path) pairs, one per wordlist
+            workers: Writer threads (default: ThreadPoolExecutor's default)
+            
+        Returns:
+            Generation statistics for each job, in input order
+        """
         header = self._generate_header()
         
+        if len(jobs) < 2 or workers == 1:
+            return [
+                self._generate_wordlist(user_inputs, output_path, header)
+                for user_inputs, output_path in jobs
+            ]
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(
+                lambda job: self._generate_wordlist(job[0], job[1], header),
+                jobs
+            ))
+    
+    def _generate_wordlist(
+        self,
+        user_inputs: List[str],
+        output_path: str,
+        header: str,
+        output: Optional[TextIO] = None
+    ) -> Dict[str, any]:
+        """Build and write one wordlist under an already rendered header."""
+        # Strip, filter and dedupe once, so "john" and "john " aren't processed
+        # twice; the section helpers' own checks become no-ops
+        user_inputs = self._normalize_inputs(user_inputs)
+        
         # Section 1: User contextual items (as-is)
         contextual_section = self._generate_contextual_section(user_inputs)
-        entries.update(contextual_section)
         
         # Section 2: Common transformations (educational examples)
         transformation_section = self._generate_transformation_examples(user_inputs)
-        entries.update(transformation_section)
         
-        # Section 3: Suggestions for better passwords
-        suggestions_section = self._generate_suggestions()
-        
-        # Limit total entries
-        entries = list(entries)[:self.MAX_ENTRIES - 10]  # Reserve space for suggestions
+        # Count distinct entries across both sections without building their
+        # union, and stop counting once the cap is reached
+        cap = self.MAX_ENTRIES - 10  # Reserve space for suggestions
+        new_items = (item for item in transformation_section if item not in contextual_section)
+        total_entries = min(len(contextual_section), cap) + sum(
+            1 for _ in itertools.islice(new_items, max(0, cap - len(contextual_section)))
+        )
         
         # Write to file
+        content = self._render_wordlist(header, contextual_section, transformation_section)
         try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(header)
-                f.write("\n" + "="*80 + "\n")
-                f.write("SECTION 1: CONTEXTUAL ITEMS TO AVOID IN PASSWORDS\n")
-                f.write("="*80 + "\n\n")
-                
-                for item in contextual_section:
-                    f.write(f"{item}\n")
-                
-                f.write("\n" + "="*80 + "\n")
-                f.write("SECTION 2: EXAMPLE TRANSFORMATIONS (How Attackers Think)\n")
-                f.write("="*80 + "\n")
-                f.write("These show common mutations attackers try. DON'T use these patterns!\n\n")
-                
-                for item in transformation_section:
-                    f.write(f"{item}\n")
-                
-                f.write("\n" + "="*80 + "\n")
-                f.write("SECTION 3: RECOMMENDED SECURE PASSWORD STRATEGIES\n")
-                f.write("="*80 + "\n\n")
-                
-                for suggestion in suggestions_section:
-                    f.write(f"{suggestion}\n")
-                
-                f.write("\n" + "="*80 + "\n")
-                f.write("END OF EDUCATIONAL WORDLIST\n")
-                f.write("="*80 + "\n")
+            if output is not None:
+                output.write(content)
+                output_path = None
+            else:
+                # One write of the pre-encoded text, bypassing the text and
+                # buffering layers of Python's file objects
+                _write_bytes(output_path, content.encode('utf-8'))
             
-            logger.info(f"Educational wordlist generated: {output_path} ({len(entries)} entries)")
+            logger.info(f"Educational wordlist generated: {output_path or 'stream'} ({total_entries} entries)")
             
             return {
                 'success': True,
                 'path': output_path,
-                'total_entries': len(entries),
+                'total_entries': total_entries,
                 'contextual_count': len(contextual_section),
                 'transformation_count': len(transformation_section)
             }
@@ -108,49 +242,67 @@ class WordlistGenerator:
                 'error': str(e)
             }
     
+    def _render_wordlist(
+        self,
+        header: str,
+        contextual_section: AbstractSet[str],
+        transformation_section: Set[str]
+    ) -> str:
+        """Assemble the complete wordlist file contents."""
+        parts = [
+            header,
+            "\n", _SEP80_LINE,
+            "SECTION 1: CONTEXTUAL ITEMS TO AVOID IN PASSWORDS\n",
+            _SEP80_LINE, "\n",
+        ]
+        # One join per section instead of a formatted string per entry
+        if contextual_section:
+            parts += ("\n".join(contextual_section), "\n")
+        
+        parts += (
+            "\n", _SEP80_LINE,
+            "SECTION 2: EXAMPLE TRANSFORMATIONS (How Attackers Think)\n",
+            _SEP80_LINE,
+            "These show common mutations attackers try. DON'T use these patterns!\n\n",
+        )
+        if transformation_section:
+            parts += ("\n".join(transformation_section), "\n")
+        
+        parts += (
+            "\n", _SEP80_LINE,
+            "SECTION 3: RECOMMENDED SECURE PASSWORD STRATEGIES\n",
+            _SEP80_LINE, "\n",
+            _SUGGESTIONS_TEXT,
+            "\n", _SEP80_LINE,
+            "END OF EDUCATIONAL WORDLIST\n",
+            _SEP80_LINE,
+        )
+        
+        return "".join(parts)
+    
     def _generate_header(self) -> str:
         """Generate prominent warning header."""
-        return f"""
-{'='*80}
-⚠️  EDUCATIONAL WORDLIST - FOR AUTHORIZED USE ONLY ⚠️
-{'='*80}
-
-LEGAL NOTICE:
-This file is generated for PASSWORD AWARENESS and AUTHORIZED SECURITY TESTING only.
-
-PERMITTED USES:
-✓ Testing YOUR OWN passwords for weaknesses
-✓ Educational purposes to understand password vulnerabilities
-✓ Authorized penetration testing with written permission
-✓ Security awareness training
-
-PROHIBITED USES:
-✗ Unauthorized access attempts
-✗ Password cracking without authorization
-✗ Distribution for malicious purposes
-✗ Any illegal activity
-
-BY USING THIS FILE, YOU ACKNOWLEDGE:
-- You will use this ONLY for authorized purposes
-- You understand unauthorized access is illegal
-- You accept full responsibility for your actions
-
-Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-Tool: Password Strength Analyzer v1.0.0
-"""
+        return _HEADER_TEMPLATE.format(ts=datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
     
-    def _generate_contextual_section(self, user_inputs: List[str]) -> Set[str]:
+    def _normalize_inputs(self, user_inputs: List[str]) -> Tuple[str, ...]:
+        """Strip inputs, drop ones under 3 characters, and dedupe in order."""
+        stripped = (item.strip() for item in user_inputs if item)
+        return tuple(dict.fromkeys(item for item in stripped if len(item) >= 3))
+    
+    def _generate_contextual_section(self, user_inputs: List[str]) -> AbstractSet[str]:
         """Generate list of user contextual items."""
-        items = set()
+        # Dict keys dedupe with set-speed lookups but keep first-seen order,
+        # so the section is written the same way on every run
+        items = {}
         
         for item in user_inputs:
             if item and len(item) >= 3:
-                items.add(item.strip())
-                items.add(item.lower().strip())
-                items.add(item.upper().strip())
-                items.add(item.capitalize().strip())
+                # Strip once, before making the case variants, so padded
+                # input like " john" still yields "John"
+                item = item.strip()
+                items.update(dict.fromkeys((item, item.lower(), item.upper(), item.capitalize())))
         
-        return items
+        return items.keys()
     
     def _generate_transformation_examples(self, user_inputs: List[str]) -> Set[str]:
         """
@@ -160,18 +312,24 @@ Tool: Password Strength Analyzer v1.0.0
         examples = set()
         
         # Only process first few items to keep list small
-        for item in user_inputs[:5]:
+        items = user_inputs[:5]
+        
+        # Draw every item's years in one sample; each item still gets three of its own
+        year_pool = random.sample(self.COMMON_YEARS, min(3 * len(items), len(self.COMMON_YEARS)))
+        suffixes = self.COMMON_SUFFIXES[:3]
+        
+        for index, item in enumerate(items):
             if not item or len(item) < 3:
                 continue
             
             item = item.strip()
             
             # Example 1: Add common years
-            for year in random.sample(self.common_years, min(3, len(self.common_years))):
+            for year in year_pool[3 * index:3 * index + 3]:
                 examples.add(f"{item}{year}")
             
             # Example 2: Add common suffixes
-            for suffix in self.common_suffixes[:3]:
+            for suffix in suffixes:
                 examples.add(f"{item}{suffix}")
             
             # Example 3: Simple leet speak (just ONE example)
@@ -188,51 +346,23 @@ Tool: Password Strength Analyzer v1.0.0
         
         return examples
     
-    def _apply_leet_speak(self, text: str, max_substitutions: int = 2) -> str:
-        """Apply limited leet speak transformations."""
-        result = list(text.lower())
-        substitutions = 0
+    def _apply_leet_speak(self, text: str, max_substitutions: Optional[int] = 2) -> str:
+        """Apply limited leet speak transformations (None substitutes every letter)."""
+        text = text.lower()
         
-        for i, char in enumerate(result):
-            if char in self.leet_map and substitutions < max_substitutions:
-                result[i] = self.leet_map[char]
-                substitutions += 1
+        if max_substitutions is None or max_substitutions >= len(text):
+            # The limit can't bind, so translate the whole string in C
+            return text.translate(self._LEET_TRANS)
         
-        return ''.join(result)
+        if max_substitutions <= 0:
+            return text
+        
+        # The regex engine finds the first few candidates; Python only runs
+        # per replacement, not per character
+        return self._LEET_RE.sub(
+            lambda match: self.LEET_MAP[match.group()], text, count=max_substitutions
+        )
     
-    def _generate_suggestions(self) -> List[str]:
+    def _generate_suggestions(self) -> Tuple[str, ...]:
         """Generate secure password suggestions."""
-        return [
-            "",
-            "INSTEAD OF weak passwords, USE THESE STRATEGIES:",
-            "",
-            "1. PASSPHRASES (Recommended):",
-            "   - Combine 4-6 random, unrelated words",
-            "   - Example: correct-horse-battery-staple",
-            "   - Easy to remember, hard to crack",
-            "",
-            "2. PASSWORD MANAGER GENERATED:",
-            "   - Use a password manager (e.g., Bitwarden, 1Password, KeePass)",
-            "   - Generate unique 16+ character passwords for each account",
-            "   - Example: Kp9$mN2#vL8@wQ5&",
-            "",
-            "3. DICE WARE METHOD:",
-            "   - Use physical dice to randomly select words from a wordlist",
-            "   - Ensures true randomness",
-            "   - Combine 5-7 words for strong security",
-            "",
-            "4. AVOID THESE PATTERNS:",
-            "   ✗ Personal information (names, birthdays, addresses)",
-            "   ✗ Dictionary words with simple substitutions",
-            "   ✗ Common sequences (123, abc, qwerty)",
-            "   ✗ Keyboard patterns",
-            "   ✗ Repeating the same password across sites",
-            "",
-            "5. ENABLE TWO-FACTOR AUTHENTICATION (2FA):",
-            "   - Even strong passwords benefit from 2FA",
-            "   - Use authenticator apps (not SMS when possible)",
-            "",
-            "REMEMBER: Length + Randomness = Security",
-            "Aim for: 12+ characters (passphrases) or 16+ (random passwords)",
-            ""
-        ]
+        return _SUGGESTIONS
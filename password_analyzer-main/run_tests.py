@@ -4,8 +4,11 @@ Test runner script for Password Analyzer.
 Runs all tests and provides a summary.
 """
 
+import importlib.util
 import subprocess
 import sys
+import tempfile
+import xml.etree.ElementTree as ET
 from pathlib import Path
 
 
@@ -16,19 +19,23 @@ def print_header(text):
     print("="*80 + "\n")
 
 
+def parallel_args():
+    """pytest-xdist options when the plugin is installed, otherwise none."""
+    if importlib.util.find_spec("xdist") is None:
+        return []
+    # loadfile keeps each test file on one worker, so module and session
+    # fixtures are still built once per file
+    return ["-n", "auto", "--dist=loadfile"]
+
+
 def run_tests():
     """Run all tests with pytest."""
     print_header("PASSWORD ANALYZER - TEST SUITE")
     
     print("Checking if pytest is installed...")
-    try:
-        result = subprocess.run(
-            [sys.executable, "-m", "pytest", "--version"],
-            capture_output=True,
-            text=True
-        )
-        print(result.stdout)
-    except Exception as e:
+    # pytest prints its own version; a missing module shows up as a failed run
+    result = subprocess.run([sys.executable, "-m", "pytest", "--version"])
+    if result.returncode != 0:
         print(f"❌ pytest not found. Installing...")
         subprocess.run([sys.executable, "-m", "pip", "install", "pytest", "pytest-cov"])
     
@@ -36,7 +43,7 @@ def run_tests():
     
     # Run tests with verbose output
     result = subprocess.run(
-        [sys.executable, "-m", "pytest", "tests/", "-v", "--tb=short"],
+        [sys.executable, "-m", "pytest", "tests/", "-v", "--tb=short", *parallel_args()],
         cwd=Path(__file__).parent
     )
     
@@ -79,19 +86,50 @@ def run_specific_tests():
         ("Pattern Detector Tests", "tests/test_pattern_detector.py"),
         ("Wordlist Generator Tests", "tests/test_wordlist_generator.py"),
         ("EULA Manager Tests", "tests/test_eula.py"),
+        ("GUI Batch Worker Tests", "tests/test_gui.py"),
     ]
     
-    results = {}
+    print("\nRunning all categories...")
     
-    for name, test_file in test_files:
-        print(f"\nRunning {name}...")
-        result = subprocess.run(
-            [sys.executable, "-m", "pytest", test_file, "-v"],
-            cwd=Path(__file__).parent,
-            capture_output=True
+    # Dotted module name pytest reports for each file
+    modules = {
+        name: Path(test_file).with_suffix("").as_posix().replace("/", ".")
+        for name, test_file in test_files
+    }
+    
+    # One pytest run for every file, so interpreter start-up and collection
+    # are paid once; the JUnit report gives per-file results
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        report_path = Path(tmp_dir) / "report.xml"
+        subprocess.run(
+            [
+                sys.executable, "-m", "pytest",
+                *(test_file for _, test_file in test_files),
+                "-v",
+                # Keep categories independent, as separate runs were
+                "--continue-on-collection-errors",
+                f"--junitxml={report_path}",
+                *parallel_args()
+            ],
+            cwd=Path(__file__).parent
         )
-        results[name] = result.returncode == 0
-        print("✅ PASSED" if results[name] else "❌ FAILED")
+        
+        reported = []
+        if report_path.exists():
+            for case in ET.parse(report_path).iter("testcase"):
+                # Collection errors name the module instead of a class
+                module = case.get("classname") or case.get("name")
+                failed = case.find("failure") is not None or case.find("error") is not None
+                reported.append((module, failed))
+    
+    results = {}
+    for name, module in modules.items():
+        outcomes = [
+            failed for reported_module, failed in reported
+            if reported_module == module or reported_module.startswith(module + ".")
+        ]
+        # A file with no reported tests didn't run (e.g. aborted collection)
+        results[name] = bool(outcomes) and not any(outcomes)
     
     print_header("Test Summary")
     for name, passed in results.items():
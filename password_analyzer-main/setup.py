@@ -39,6 +39,12 @@ setup(
         "dev": [
             "pytest>=7.4.0",
             "pytest-cov>=4.1.0",
+            "pytest-xdist>=3.3.0",
+        ],
+        "speedups": [
+            "pyahocorasick>=2.0.0",
+            "numba>=0.58.0",
+            "numpy>=1.24.0",
         ],
     },
     entry_points={
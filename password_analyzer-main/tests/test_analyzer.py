@@ -2,16 +2,27 @@
 Unit tests for password analyzer module.
 """
 
+import multiprocessing
+import os
 import pytest
+from concurrent.futures import ThreadPoolExecutor
+from password_analyzer import analyzer as analyzer_module
 from password_analyzer.analyzer import PasswordAnalyzer
 
 
+@pytest.fixture(scope="module")
+def shared_analyzer():
+    """One analyzer for the module, so its analysis cache stays warm across tests."""
+    return PasswordAnalyzer()
+
+
 class TestPasswordAnalyzer:
     """Test suite for PasswordAnalyzer."""
     
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def use_shared_analyzer(self, shared_analyzer):
         """Setup test fixtures."""
-        self.analyzer = PasswordAnalyzer()
+        self.analyzer = shared_analyzer
     
     def test_empty_password(self):
         """Test handling of empty password."""
@@ -91,6 +102,153 @@ class TestPasswordAnalyzer:
         assert results[0]['has_contextual_risk']
         assert results[1]['has_contextual_risk']
     
+    def test_batch_analyze_large_preserves_order(self):
+        """Test that large (parallel) batches keep input order."""
+        passwords = [f"pass{i}word" for i in range(20)] + ["john2000"]
+        results = self.analyzer.batch_analyze(passwords, user_inputs=["john"])
+        
+        assert len(results) == len(passwords)
+        assert [r['password_length'] for r in results] == [len(p) for p in passwords]
+        assert results[-1]['has_contextual_risk']
+    
+    def test_repeated_analysis_cached(self):
+        """Test that repeated analyses match and don't share mutations."""
+        result1 = self.analyzer.analyze("letmein", user_inputs=["john"])
+        result1['overall_risk'] = 'MUTATED'
+        result2 = self.analyzer.analyze("letmein", user_inputs=["john"])
+        
+        assert result2['overall_risk'] != 'MUTATED'
+        assert result2['password_length'] == 7
+        
+        self.analyzer.cache_clear()
+        result3 = self.analyzer.analyze("letmein", user_inputs=["john"])
+        assert result3['zxcvbn_score'] == result2['zxcvbn_score']
+    
+    def test_batch_with_duplicates(self):
+        """Test that duplicate passwords each get their own result."""
+        passwords = ["123456", "password", "123456", "123456"]
+        results = self.analyzer.batch_analyze(passwords)
+        
+        assert len(results) == 4
+        assert results[0] == results[2] == results[3]
+        assert results[0] is not results[2]
+    
+    def test_batch_analyze_iter(self):
+        """Test streaming batch analysis from a generator."""
+        passwords = ["john123", "weak", "Str0ng!P@ssw0rd"]
+        results = list(self.analyzer.batch_analyze_iter(
+            (p for p in passwords),
+            user_inputs=["john"]
+        ))
+        
+        assert [r['password_length'] for r in results] == [len(p) for p in passwords]
+        assert results[0]['has_contextual_risk']
+    
+    def test_batch_analyze_iter_reads_lazily(self):
+        """Test that parallel streaming only reads a bounded window ahead."""
+        consumed = []
+        
+        def passwords():
+            for i in range(3000):
+                consumed.append(i)
+                yield f"pass{i}word"
+        
+        results = self.analyzer.batch_analyze_iter(passwords(), workers=2)
+        first = next(results)
+        assert first['password_length'] == len("pass0word")
+        assert len(consumed) < 3000
+        results.close()
+    
+    def test_batch_analyze_iter_spawn_context(self):
+        """Test that streaming works with spawned (not forked) pool workers."""
+        passwords = [f"pass{i}word" for i in range(10)]
+        results = list(self.analyzer.batch_analyze_iter(
+            passwords,
+            workers=2,
+            mp_context=multiprocessing.get_context("spawn")
+        ))
+        
+        assert [r['password_length'] for r in results] == [len(p) for p in passwords]
+    
+    @pytest.mark.parametrize("chunksize,cache_size", [(256, 8192), (4, 8192), (4, 2)])
+    def test_batch_analyze_iter_dedupes(self, monkeypatch, chunksize, cache_size):
+        """Test that parallel streaming analyzes repeats once and keeps input order."""
+        analyzed = []
+        analyze_chunk = analyzer_module._analyze_chunk
+        
+        def recording_chunk(chunk, *args):
+            analyzed.extend(chunk)
+            return analyze_chunk(chunk, *args)
+        
+        # Threads share the patched module, so the workers' calls can be counted
+        monkeypatch.setattr(
+            analyzer_module,
+            "ProcessPoolExecutor",
+            lambda mp_context=None, **kwargs: ThreadPoolExecutor(**kwargs)
+        )
+        monkeypatch.setattr(analyzer_module, "_analyze_chunk", recording_chunk)
+        monkeypatch.setattr(analyzer_module, "STREAM_CHUNKSIZE", chunksize)
+        monkeypatch.setattr(analyzer_module, "ANALYSIS_CACHE_SIZE", cache_size)
+        
+        passwords = [f"pass{i % 5}word{'x' * (i % 5)}" for i in range(40)] + ["john2000"] * 3
+        results = list(self.analyzer.batch_analyze_iter(passwords, user_inputs=["john"], workers=2))
+        
+        assert [r['password_length'] for r in results] == [len(p) for p in passwords]
+        assert results[0] == results[5]
+        assert results[0] is not results[5]
+        assert results[-1]['has_contextual_risk']
+        if cache_size > len(set(passwords)):
+            assert sorted(analyzed) == sorted(set(passwords))
+    
+    def test_default_workers_respects_affinity(self):
+        """Test that the default pool size counts only usable CPUs."""
+        workers = analyzer_module._default_workers()
+        assert 1 <= workers <= (os.cpu_count() or 1)
+        if hasattr(os, 'sched_getaffinity'):
+            assert workers == len(os.sched_getaffinity(0))
+    
+    def test_fast_path_extremes(self):
+        """Test that fast mode triages extremes and defers the middle band."""
+        weak = self.analyzer.analyze("abc", fast=True)
+        assert weak['zxcvbn_score'] == 0
+        assert weak['overall_risk'] == 'VERY_HIGH'
+        
+        # All four classes, no leet or other patterns: answered from entropy
+        strong = self.analyzer.analyze("xK6#mQ2%vLwR&uT^zN6*yH2=", fast=True)
+        assert strong['zxcvbn_score'] == 4
+        assert strong['overall_risk'] == 'VERY_LOW'
+        assert strong['guesses'] == strong['entropy']['total_combinations']
+        
+        # Context still wins at the strong end
+        risky = self.analyzer.analyze("xK9#mQ2$vL7!pR4&wT8^johnsmith", user_inputs=["john"], fast=True)
+        assert risky['overall_risk'] == 'CRITICAL'
+        
+        middle = self.analyzer.analyze("letmein2024", fast=True)
+        assert middle == self.analyzer.analyze("letmein2024")
+    
+    @pytest.mark.parametrize("password", [
+        "passwordpasswordpassword",
+        "1234567890123456789012345678",
+        "qwertyuiopasdfghjklzxcvbnm",
+        "a" * 30,
+        "P@ssw0rdP@ssw0rdP@ssw0rd!1",
+    ])
+    def test_fast_path_defers_weak_long_passwords(self, password):
+        """Test that high entropy alone doesn't fast-track weak long passwords."""
+        fast = self.analyzer.analyze(password, fast=True)
+        full = self.analyzer.analyze(password)
+        
+        assert fast['zxcvbn_score'] == full['zxcvbn_score'] < 4
+        assert fast['overall_risk'] == full['overall_risk']
+    
+    def test_fast_path_weak_recommendations_without_entropy(self):
+        """Test that a fast weak verdict never recommends the password."""
+        result = self.analyzer.analyze("abc", use_entropy=False, fast=True)
+        
+        assert result['entropy'] is None
+        assert result['overall_risk'] == 'VERY_HIGH'
+        assert not any(r.startswith("✅") for r in result['recommendations'])
+    
     def test_password_length(self):
         """Test password length is recorded correctly."""
         password = "TestPassword123"
@@ -3,6 +3,7 @@ Unit tests for entropy calculator.
 """
 
 import pytest
+from password_analyzer import entropy
 from password_analyzer.entropy import EntropyCalculator
 
 
@@ -87,6 +88,30 @@ class TestEntropyCalculator:
         expected_combinations = 26 ** 3
         assert result['total_combinations'] == expected_combinations
     
+    def test_calculate_batch_matches_calculate(self):
+        """Test batch calculation agrees with per-password calculation."""
+        passwords = ["password", "", "Pass word 123", "P@ssw0rd", "пароль1", "abc"]
+        results = self.calculator.calculate_batch(passwords)
+        
+        assert results == [self.calculator.calculate(p) for p in passwords]
+    
+    def test_calculate_batch_without_numba(self, monkeypatch):
+        """Test the NumPy/pure-Python batch fallbacks agree too."""
+        monkeypatch.setattr(entropy, "_numba_class_masks", None)
+        passwords = ["password", "", "Pass word 123", "P@ssw0rd", "пароль1"]
+        
+        assert self.calculator.calculate_batch(passwords) == [
+            self.calculator.calculate(p) for p in passwords
+        ]
+    
+    def test_very_long_password(self):
+        """Test that huge search spaces don't overflow."""
+        result = self.calculator.calculate("a" * 300)
+        
+        assert result['strength_rating'] == "Very Strong"
+        assert result['total_combinations'] == float('inf')
+        assert all(t == "centuries+" for t in result['crack_times'].values())
+    
     def test_time_formatting(self):
         """Test time formatting function."""
         assert "instant" in self.calculator._format_time(0.5)
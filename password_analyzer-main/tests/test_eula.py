@@ -4,29 +4,20 @@ Unit tests for EULA manager.
 
 import pytest
 import os
-from pathlib import Path
 from password_analyzer.eula import EULAManager
 
 
 class TestEULAManager:
     """Test suite for EULAManager."""
     
-    def setup_method(self):
-        """Setup test fixtures."""
-        # Use a temporary test directory
-        self.test_dir = Path("test_config")
-        self.test_dir.mkdir(exist_ok=True)
+    @pytest.fixture(autouse=True)
+    def isolated_eula(self, tmp_path):
+        """Give each test a manager in its own temporary directory."""
+        # pytest creates and removes tmp_path, and parallel runs can't collide
+        self.test_dir = tmp_path
         self.eula = EULAManager(config_dir=str(self.test_dir))
-    
-    def teardown_method(self):
-        """Cleanup test files."""
-        # Remove test files
-        if self.eula.eula_file.exists():
-            self.eula.eula_file.unlink()
-        if self.eula.log_file.exists():
-            self.eula.log_file.unlink()
-        if self.test_dir.exists():
-            self.test_dir.rmdir()
+        yield
+        self.eula.close()
     
     def test_eula_not_accepted_initially(self):
         """Test that EULA is not accepted by default."""
@@ -105,16 +96,12 @@ class TestEULAManager:
     
     def test_config_directory_creation(self):
         """Test that config directory is created."""
-        new_dir = Path("test_new_config")
-        if new_dir.exists():
-            new_dir.rmdir()
+        new_dir = self.test_dir / "new_config"
         
         eula = EULAManager(config_dir=str(new_dir))
         
         assert new_dir.exists()
-        
-        # Cleanup
-        new_dir.rmdir()
+        eula.close()
     
     def test_log_action_with_empty_details(self):
         """Test logging action without details."""
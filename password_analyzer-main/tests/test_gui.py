@@ -0,0 +1,50 @@
+"""
+Unit tests for the GUI batch worker.
+"""
+
+import queue
+import threading
+import pytest
+
+gui = pytest.importorskip("password_analyzer.gui")
+from password_analyzer import analyzer as analyzer_module
+from password_analyzer.analyzer import PasswordAnalyzer
+
+
+class TestBatchWorker:
+    """Test suite for the GUI batch worker, run without a Tk window."""
+    
+    @pytest.fixture(autouse=True)
+    def setup_worker(self, monkeypatch):
+        """Setup a GUI object with only the batch worker's state."""
+        # Serial analysis keeps the test fast; posting order doesn't depend on it
+        monkeypatch.setattr(analyzer_module, "_default_workers", lambda: 1)
+        self.app = gui.PasswordAnalyzerGUI.__new__(gui.PasswordAnalyzerGUI)
+        self.app.analyzer = PasswordAnalyzer()
+        self.app._result_queue = queue.Queue()
+        self.app._batch_cancel = threading.Event()
+        self.app._batch_bytes_read = 0
+        self.app._batch_error = None
+    
+    def drain(self):
+        """Collect everything the worker posted, up to the done marker."""
+        items = []
+        while True:
+            item = self.app._result_queue.get_nowait()
+            if item is gui._BATCH_DONE:
+                return items
+            items.append(item)
+    
+    def test_trailing_duplicates_posted(self, tmp_path):
+        """Test that duplicates after the last distinct password are still posted."""
+        passwords = [f"pass{i}word" for i in range(20)] + ["pass3word", "pass0word"]
+        path = tmp_path / "passwords.txt"
+        path.write_text("\n".join(passwords), encoding='utf-8')
+        
+        self.app._batch_worker(str(path), [])
+        items = self.drain()
+        
+        assert [i for i, _ in items] == list(range(len(passwords)))
+        assert [r['password_length'] for _, r in items] == [len(p) for p in passwords]
+        assert items[20][1] == items[3][1]
+        assert self.app._batch_error is None
@@ -3,47 +3,64 @@ Unit tests for pattern detector.
 """
 
 import pytest
+from password_analyzer import pattern_detector
 from password_analyzer.pattern_detector import PatternDetector
 
 
 class TestPatternDetector:
     """Test suite for PatternDetector."""
     
-    def setup_method(self):
+    @classmethod
+    def setup_class(cls):
         """Setup test fixtures."""
-        self.detector = PatternDetector()
-    
-    def test_repeated_sequences(self):
-        """Test detection of repeated character sequences."""
-        patterns = self.detector.detect_patterns("aaabbb")
-        assert len(patterns['repeated_sequences']) > 0
-        
-        patterns2 = self.detector.detect_patterns("111222")
-        assert len(patterns2['repeated_sequences']) > 0
-    
-    def test_no_repeated_sequences(self):
-        """Test password without repeated sequences."""
-        patterns = self.detector.detect_patterns("abcdef123")
-        assert len(patterns['repeated_sequences']) == 0
-    
-    def test_keyboard_patterns(self):
-        """Test detection of keyboard patterns."""
-        patterns1 = self.detector.detect_patterns("qwerty123")
-        assert len(patterns1['keyboard_patterns']) > 0
-        
-        patterns2 = self.detector.detect_patterns("asdfgh")
-        assert len(patterns2['keyboard_patterns']) > 0
-    
-    def test_date_patterns(self):
-        """Test detection of date patterns."""
-        patterns1 = self.detector.detect_patterns("password1990")
-        assert len(patterns1['dates']) > 0
-        
-        patterns2 = self.detector.detect_patterns("test20230101")
-        assert len(patterns2['dates']) > 0
-        
-        patterns3 = self.detector.detect_patterns("pass01/01/2023")
-        assert len(patterns3['dates']) > 0
+        # Detection is pure, so one detector (and its warm cache) serves every test
+        cls.detector = PatternDetector()
+    
+    @pytest.mark.parametrize("password,key,found", [
+        # Repeated character sequences
+        ("aaabbb", "repeated_sequences", True),
+        ("111222", "repeated_sequences", True),
+        ("abcdef123", "repeated_sequences", False),
+        # Keyboard patterns, case insensitive
+        ("qwerty123", "keyboard_patterns", True),
+        ("asdfgh", "keyboard_patterns", True),
+        ("QWERTY", "keyboard_patterns", True),
+        ("qwerty", "keyboard_patterns", True),
+        # Dates
+        ("password1990", "dates", True),
+        ("test20230101", "dates", True),
+        ("pass01/01/2023", "dates", True),
+        # Sequential numbers and letters
+        ("password123", "sequential", True),
+        ("abcdef", "sequential", True),
+        # Leet speak; a character mapping to two letters counts once
+        ("p4ssw0rd", "leet_speak", True),
+        ("h3ll0w0rld", "leet_speak", True),
+        ("pass1", "leet_speak", False),
+        ("password", "leet_speak", False),
+        # Common substitutions
+        ("password", "common_substitutions", False),
+    ])
+    def test_pattern_found(self, password, key, found):
+        """Test whether a single pattern kind is detected in a password."""
+        patterns = self.detector.detect_patterns(password)
+        assert bool(patterns[key]) == found
+    
+    def test_date_patterns_whole_match(self):
+        """Test that dates are reported as whole, non-overlapping matches."""
+        assert self.detector.detect_patterns("password1990")['dates'] == ['1990']
+        assert self.detector.detect_patterns("test20230101")['dates'] == ['20230101']
+        assert self.detector.detect_patterns("x1999y2005")['dates'] == ['1999', '2005']
+    
+    def test_leet_mappings_read_only(self):
+        """Test that the shared leet table can't be modified through a detector."""
+        with pytest.raises(TypeError):
+            self.detector.LEET_MAPPINGS['x'] = ('%',)
+    
+    def test_date_regex_has_no_groups(self):
+        """Test that findall on the date regex yields whole matches, not groups."""
+        assert pattern_detector._DATE_RE.groups == 0
+        assert self.detector._find_dates("born2001") == ['2001']
     
     def test_no_date_patterns(self):
         """Test password without date patterns."""
@@ -51,36 +68,12 @@ class TestPatternDetector:
         # This test might detect year-like patterns, so we check it doesn't crash
         assert 'dates' in patterns
     
-    def test_sequential_numbers(self):
-        """Test detection of sequential numbers."""
-        patterns = self.detector.detect_patterns("password123")
-        assert len(patterns['sequential']) > 0
-    
-    def test_sequential_letters(self):
-        """Test detection of sequential letters."""
-        patterns = self.detector.detect_patterns("abcdef")
-        assert len(patterns['sequential']) > 0
-    
     def test_no_sequential(self):
         """Test password without sequential patterns."""
         patterns = self.detector.detect_patterns("Tr0ub4dor")
         # May or may not detect depending on content
         assert 'sequential' in patterns
     
-    def test_leet_speak_detection(self):
-        """Test detection of leet speak."""
-        # Password with leet speak
-        patterns1 = self.detector.detect_patterns("p4ssw0rd")
-        assert patterns1['leet_speak'] == True
-        
-        patterns2 = self.detector.detect_patterns("h3ll0w0rld")
-        assert patterns2['leet_speak'] == True
-    
-    def test_no_leet_speak(self):
-        """Test password without leet speak."""
-        patterns = self.detector.detect_patterns("password")
-        assert patterns['leet_speak'] == False
-    
     def test_common_substitutions(self):
         """Test detection of common character substitutions."""
         patterns = self.detector.detect_patterns("p@ssw0rd")
@@ -88,10 +81,16 @@ class TestPatternDetector:
         assert any('@' in sub for sub in patterns['common_substitutions'])
         assert any('0' in sub for sub in patterns['common_substitutions'])
     
-    def test_no_substitutions(self):
-        """Test password without common substitutions."""
-        patterns = self.detector.detect_patterns("password")
-        assert len(patterns['common_substitutions']) == 0
+    def test_short_passwords(self):
+        """Test that very short passwords still get per-character checks."""
+        empty = self.detector.detect_patterns("")
+        assert empty['repeated_sequences'] == []
+        assert empty['leet_speak'] == False
+        
+        patterns = self.detector.detect_patterns("4@")
+        assert patterns['leet_speak'] == True
+        assert patterns['common_substitutions'] == ['@→a']
+        assert patterns['sequential'] == []
     
     def test_all_patterns_keys_present(self):
         """Test that all expected pattern keys are present."""
@@ -117,10 +116,83 @@ class TestPatternDetector:
         assert len(patterns['keyboard_patterns']) > 0
         assert len(patterns['sequential']) > 0
     
-    def test_case_insensitive_keyboard(self):
-        """Test keyboard pattern detection is case insensitive."""
-        patterns1 = self.detector.detect_patterns("QWERTY")
-        patterns2 = self.detector.detect_patterns("qwerty")
+    def test_compiled_scan_matches_fallback(self, monkeypatch):
+        """Test that the compiled scan agrees with the regex implementation."""
+        monkeypatch.setattr(pattern_detector, "AUTOMATON_JIT_MIN_LENGTH", pattern_detector.JIT_MIN_LENGTH)
+        passwords = [
+            "qwerty123abc", "aaaabbbbzyxw", "P4ssw0rd!!!xyz", "Tr0ub4dor&3",
+            "x01/02/2023y19991231", "2020-1-15/9x123456"
+        ]
+        compiled = [self.detector.detect_patterns(p) for p in passwords]
+        
+        monkeypatch.setattr(pattern_detector, "_scan_password_features", None)
+        fallback = [PatternDetector().detect_patterns(p) for p in passwords]
+        
+        assert compiled == fallback
+    
+    def test_keyboard_automaton_matches_fallback(self, monkeypatch):
+        """Test that keyboard detection is the same with and without pyahocorasick."""
+        passwords = ["qwertyuiop", "ytrewq!QAZ", "1qaz2wsx#edc", "nothing"]
+        fast = [self.detector.detect_patterns(p)['keyboard_patterns'] for p in passwords]
+        
+        monkeypatch.setattr(pattern_detector, "_KEYBOARD_AUTOMATON", None)
+        slow = [PatternDetector().detect_patterns(p)['keyboard_patterns'] for p in passwords]
+        
+        assert fast == slow
+        assert fast[0] == ['qwerty', 'qwertyuiop']
+    
+    def test_detect_patterns_many_matches_single(self):
+        """Test that batch detection agrees with per-password detection."""
+        passwords = [
+            "qwe", "rty", "aa", "a", "x1999", "2005y", "", "İqwerty", "p4ss\x00\x00\x00",
+            "qwerty123abc", "01/01/2023", "zzz"
+        ]
+        
+        assert self.detector.detect_patterns_many(passwords) == [
+            self.detector.detect_patterns(p) for p in passwords
+        ]
+        assert self.detector.detect_patterns_many(passwords[:-4]) == [
+            self.detector.detect_patterns(p) for p in passwords[:-4]
+        ]
+        assert self.detector.detect_patterns_many([]) == []
+    
+    def test_repeated_detection_cached(self):
+        """Test that cached reports match and don't share mutations."""
+        patterns1 = self.detector.detect_patterns("qwerty1990")
+        patterns1['keyboard_patterns'].append('MUTATED')
+        patterns2 = self.detector.detect_patterns("qwerty1990")
+        
+        assert 'MUTATED' not in patterns2['keyboard_patterns']
+        
+        self.detector.clear_cache()
+        assert self.detector.cache_info().currsize == 0
+        assert self.detector.detect_patterns("qwerty1990") == patterns2
+        
+        hits = self.detector.cache_info().hits
+        self.detector.detect_patterns("qwerty1990")
+        assert self.detector.cache_info().hits == hits + 1
+    
+    @pytest.mark.skipif(pattern_detector.np is None, reason="numpy not installed")
+    def test_vectorized_sequential_matches_loop(self, monkeypatch):
+        """Test that the NumPy sequential check agrees with the Python loop."""
+        monkeypatch.setattr(pattern_detector, "_SEQUENTIAL_AUTOMATON", None)
+        passwords = ["abc123zyx987", "XYZabcDEF", "a1b2c3d4e5", "9876543210cba"]
+        vectorized = [self.detector._find_sequential(p) for p in passwords]
+        
+        monkeypatch.setattr(pattern_detector, "np", None)
+        loop = [self.detector._find_sequential(p) for p in passwords]
+        
+        assert vectorized == loop
+    
+    @pytest.mark.skipif(pattern_detector.ahocorasick is None, reason="pyahocorasick not installed")
+    def test_automaton_sequential_matches_loop(self, monkeypatch):
+        """Test that the Aho-Corasick sequential check agrees with the Python loop."""
+        passwords = ["abc123zyx987", "XYZabcDEF", "a1b2c3d4e5", "9876543210cba", "12", "aBcD"]
+        automaton = [self.detector._find_sequential(p) for p in passwords]
+        
+        monkeypatch.setattr(pattern_detector, "_SEQUENTIAL_AUTOMATON", None)
+        monkeypatch.setattr(pattern_detector, "np", None)
+        loop = [self.detector._find_sequential(p) for p in passwords]
         
-        assert len(patterns1['keyboard_patterns']) > 0
-        assert len(patterns2['keyboard_patterns']) > 0
+        assert automaton == loop
+        assert automaton[0] == ['123', '987', 'abc', 'zyx']
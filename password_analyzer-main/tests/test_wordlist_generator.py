@@ -2,47 +2,53 @@
 Unit tests for wordlist generator.
 """
 
+import io
 import pytest
 import os
 from pathlib import Path
+from password_analyzer import wordlist_generator
 from password_analyzer.wordlist_generator import WordlistGenerator
 
 
+@pytest.fixture(scope="session")
+def basic_wordlist(tmp_path_factory):
+    """Generate the ["test"] wordlist once; returns (result, file content)."""
+    path = tmp_path_factory.mktemp("wl") / "wl.txt"
+    result = WordlistGenerator().generate_educational_wordlist(["test"], output_path=str(path))
+    return result, path.read_text(encoding='utf-8')
+
+
 class TestWordlistGenerator:
     """Test suite for WordlistGenerator."""
     
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def setup_generator(self, tmp_path):
         """Setup test fixtures."""
         self.generator = WordlistGenerator()
-        self.test_output = "test_wordlist.txt"
-    
-    def teardown_method(self):
-        """Cleanup test files."""
-        if os.path.exists(self.test_output):
-            os.remove(self.test_output)
+        # Per-test path, so parallel workers never share an output file
+        self.test_output = str(tmp_path / "test_wordlist.txt")
     
-    def test_generate_wordlist_success(self):
+    def test_generate_wordlist_success(self, basic_wordlist):
         """Test successful wordlist generation."""
-        user_inputs = ["john", "smith", "test"]
-        result = self.generator.generate_educational_wordlist(
-            user_inputs,
-            output_path=self.test_output
-        )
+        result, content = basic_wordlist
         
         assert result['success']
-        assert os.path.exists(self.test_output)
+        assert os.path.exists(result['path'])
         assert result['total_entries'] > 0
     
-    def test_wordlist_file_content(self):
-        """Test that generated file contains expected sections."""
-        user_inputs = ["test"]
-        self.generator.generate_educational_wordlist(
-            user_inputs,
-            output_path=self.test_output
-        )
+    def test_wordlist_to_stream(self):
+        """Test that a wordlist can be written to a text stream instead of a file."""
+        buf = io.StringIO()
+        result = self.generator.generate_educational_wordlist(["test"], output=buf)
         
-        with open(self.test_output, 'r', encoding='utf-8') as f:
-            content = f.read()
+        assert result['success']
+        assert result['path'] is None
+        assert not os.path.exists(self.test_output)
+        assert "SECTION 1" in buf.getvalue()
+    
+    def test_wordlist_file_content(self, basic_wordlist):
+        """Test that generated file contains expected sections."""
+        result, content = basic_wordlist
         
         # Check for warning header
         assert "EDUCATIONAL WORDLIST" in content
@@ -62,12 +68,34 @@ class TestWordlistGenerator:
         user_inputs = [f"item{i}" for i in range(100)]
         result = self.generator.generate_educational_wordlist(
             user_inputs,
-            output_path=self.test_output
+            output=io.StringIO()
         )
         
         # Should be limited to MAX_ENTRIES
         assert result['total_entries'] <= self.generator.MAX_ENTRIES
     
+    def test_generate_batch(self, tmp_path):
+        """Test generating several wordlists in one call."""
+        jobs = [
+            (["john", "smith"], str(tmp_path / "john.txt")),
+            (["mary"], str(tmp_path / "mary.txt")),
+            (["dave"], str(tmp_path / "missing" / "dave.txt")),
+        ]
+        results = self.generator.generate_batch(jobs)
+        
+        assert [r['success'] for r in results] == [True, True, False]
+        assert results[0]['path'] == jobs[0][1]
+        assert "john" in (tmp_path / "john.txt").read_text(encoding='utf-8')
+        assert "mary" in (tmp_path / "mary.txt").read_text(encoding='utf-8')
+    
+    def test_large_output_written_buffered(self, tmp_path, monkeypatch):
+        """Test that outputs over the direct-write limit are written intact."""
+        monkeypatch.setattr(wordlist_generator, "DIRECT_WRITE_LIMIT", 16)
+        result = self.generator.generate_educational_wordlist(["john"], str(tmp_path / "a.txt"))
+        
+        assert result['success']
+        assert "END OF EDUCATIONAL WORDLIST" in (tmp_path / "a.txt").read_text(encoding='utf-8')
+    
     def test_empty_inputs(self):
         """Test handling of empty user inputs."""
         result = self.generator.generate_educational_wordlist(
@@ -111,6 +139,13 @@ class TestWordlistGenerator:
         # Should be different from original
         assert leet != text
     
+    def test_leet_speak_substitution_limit(self):
+        """Test that only the first substitutions are applied, up to the limit."""
+        assert self.generator._apply_leet_speak("Toast", max_substitutions=2) == "70ast"
+        assert self.generator._apply_leet_speak("Toast", max_substitutions=0) == "toast"
+        assert self.generator._apply_leet_speak("Toast", max_substitutions=10) == "70457"
+        assert self.generator._apply_leet_speak("Toast", max_substitutions=None) == "70457"
+    
     def test_suggestions_generation(self):
         """Test suggestions section."""
         suggestions = self.generator._generate_suggestions()
@@ -136,6 +171,24 @@ class TestWordlistGenerator:
         # Should include different case variations
         assert "test" in items or "TEST" in items or "Test" in items
     
+    def test_case_variations_of_padded_input(self):
+        """Test that surrounding whitespace is stripped before casing."""
+        items = self.generator._generate_contextual_section(["  john "])
+        
+        assert items == {"john", "JOHN", "John"}
+    
+    def test_contextual_section_keeps_input_order(self):
+        """Test that contextual items are deduplicated in first-seen order."""
+        items = self.generator._generate_contextual_section(["john", "Mary", "JOHN"])
+        
+        assert list(items) == ["john", "JOHN", "John", "Mary", "mary", "MARY"]
+    
+    def test_duplicate_inputs_normalized(self):
+        """Test that padded and repeated inputs are processed once, in order."""
+        normalized = self.generator._normalize_inputs(["john", " john ", "", "ab", "mary", "john"])
+        
+        assert normalized == ("john", "mary")
+    
     def test_short_inputs_filtered(self):
         """Test that very short inputs are filtered."""
         user_inputs = ["a", "ab", "abc"]
@@ -145,16 +198,9 @@ class TestWordlistGenerator:
         assert "a" not in items
         assert "ab" not in items
     
-    def test_file_encoding_utf8(self):
+    def test_file_encoding_utf8(self, basic_wordlist):
         """Test that file is written in UTF-8."""
-        user_inputs = ["test"]
-        self.generator.generate_educational_wordlist(
-            user_inputs,
-            output_path=self.test_output
-        )
-        
-        # Should be able to read as UTF-8
-        with open(self.test_output, 'r', encoding='utf-8') as f:
-            content = f.read()
+        # The fixture already read the file back as UTF-8
+        result, content = basic_wordlist
         
         assert len(content) > 0